@@ -8,6 +8,7 @@
 # pylint: disable=too-many-lines
 from __future__ import annotations
 
+import functools
 import logging
 import pathlib
 import typing
@@ -53,6 +54,19 @@ except ImportError:
     ipywidgets = None
 
 
+# whether each origin_shift option of plot_grd shifts the origin in x and in y
+_SHIFT_TABLE = {
+    "xshift": (True, False),
+    "yshift": (False, True),
+    "both_shift": (True, True),
+    "no_shift": (False, False),
+}
+
+# kwargs which are passed explicitly and so removed before forwarding the rest
+_INSET_EXCLUDE = frozenset({"fig"})
+_CBAR_EXCLUDE = frozenset({"cpt_lims", "fig_width", "hist", "grid", "fig"})
+
+
 def basemap(
     region: tuple[float, float, float, float] | None = None,
     fig_height: float = 15,
@@ -98,23 +112,26 @@ def basemap(
             fig_width=fig_width,
         )
 
+    xshift_amount = kwargs.get("xshift_amount", 1)
+    yshift_amount = kwargs.get("yshift_amount", 1)
+    title = kwargs.get("title", None)
+
+    if origin_shift != "initialize" and origin_shift not in _SHIFT_TABLE:
+        msg = "invalid string for origin shift"
+        raise ValueError(msg)
+
     # initialize figure or shift for new subplot
-    if origin_shift == "initialize":
-        fig = pygmt.Figure()
-    elif origin_shift == "xshift":
-        fig = kwargs.get("fig")
-        fig.shift_origin(xshift=(kwargs.get("xshift_amount", 1) * (fig_width + 0.4)))
+    fig = pygmt.Figure() if origin_shift == "initialize" else kwargs.get("fig")
+
+    if origin_shift == "xshift":
+        fig.shift_origin(xshift=(xshift_amount * (fig_width + 0.4)))
     elif origin_shift == "yshift":
-        fig = kwargs.get("fig")
-        fig.shift_origin(yshift=(kwargs.get("yshift_amount", 1) * (fig_height + 3)))
+        fig.shift_origin(yshift=(yshift_amount * (fig_height + 3)))
     elif origin_shift == "both_shift":
-        fig = kwargs.get("fig")
         fig.shift_origin(
-            xshift=(kwargs.get("xshift_amount", 1) * (fig_width + 0.4)),
-            yshift=(kwargs.get("yshift_amount", 1) * (fig_height + 3)),
+            xshift=(xshift_amount * (fig_width + 0.4)),
+            yshift=(yshift_amount * (fig_height + 3)),
         )
-    elif origin_shift == "no_shift":
-        fig = kwargs.get("fig")
 
     # create blank basemap
     fig.basemap(
@@ -149,12 +166,7 @@ def basemap(
     if kwargs.get("inset", False) is True:
         # removed duplicate kwargs before passing to add_inset
         new_kwargs = {
-            key: value
-            for key, value in kwargs.items()
-            if key
-            not in [
-                "fig",
-            ]
+            key: value for key, value in kwargs.items() if key not in _INSET_EXCLUDE
         }
         add_inset(
             fig,
@@ -176,7 +188,7 @@ def basemap(
         )
 
     # blank plotting call to reset projection to EPSG:3031, optionally add title
-    if kwargs.get("title", None) is None:
+    if title is None:
         fig.basemap(
             region=region,
             projection=proj,
@@ -186,7 +198,7 @@ def basemap(
         fig.basemap(
             region=region,
             projection=proj,
-            frame=f"wesn+t{kwargs.get('title')}",
+            frame=f"wesn+t{title}",
         )
 
     return fig
@@ -288,6 +300,9 @@ def plot_grd(
 
     region = typing.cast(tuple[float, float, float, float], region)
 
+    xshift_amount = kwargs.get("xshift_amount", 1)
+    yshift_amount = kwargs.get("yshift_amount", 1)
+
     # initialize figure or shift for new subplot
     if origin_shift == "initialize":
         fig = pygmt.Figure()
@@ -307,41 +322,27 @@ def plot_grd(
                 fig_width=fig_width,
             )
     else:
-        if origin_shift == "xshift":
-            fig_height = kwargs.get("fig_height", utils.get_fig_height())
-            proj, proj_latlon, fig_width, fig_height = utils.set_proj(
-                region,
-                fig_height=fig_height,
-            )
-            fig.shift_origin(  # type: ignore[union-attr]
-                xshift=(kwargs.get("xshift_amount", 1) * (fig_width + 0.4))
-            )
-        elif origin_shift == "yshift":
-            fig_height = kwargs.get("fig_height", utils.get_fig_height())
-            proj, proj_latlon, fig_width, fig_height = utils.set_proj(
-                region,
-                fig_height=fig_height,
-            )
-            fig.shift_origin(yshift=(kwargs.get("yshift_amount", 1) * (fig_height + 3)))  # type: ignore[union-attr]
-        elif origin_shift == "both_shift":
-            fig_height = kwargs.get("fig_height", utils.get_fig_height())
-            proj, proj_latlon, fig_width, fig_height = utils.set_proj(
-                region,
-                fig_height=fig_height,
-            )
-            fig.shift_origin(  # type: ignore[union-attr]
-                xshift=(kwargs.get("xshift_amount", 1) * (fig_width + 0.4)),
-                yshift=(kwargs.get("yshift_amount", 1) * (fig_height + 3)),
-            )
-        elif origin_shift == "no_shift":
-            proj, proj_latlon, fig_width, fig_height = utils.set_proj(
-                region,
-                fig_height=kwargs.get("fig_height", 15),
-            )
-
-        else:
+        shift = _SHIFT_TABLE.get(origin_shift)
+        if shift is None:
             msg = "invalid string for origin shift"
             raise ValueError(msg)
+        xshift, yshift = shift
+        # only query the current figure's height if it's needed and not supplied
+        if "fig_height" in kwargs:
+            fig_height = kwargs["fig_height"]
+        elif origin_shift == "no_shift":
+            fig_height = 15
+        else:
+            fig_height = utils.get_fig_height()
+        proj, proj_latlon, fig_width, fig_height = utils.set_proj(
+            region,
+            fig_height=fig_height,
+        )
+        if xshift or yshift:
+            fig.shift_origin(  # type: ignore[union-attr]
+                xshift=(xshift_amount * (fig_width + 0.4)) if xshift else None,
+                yshift=(yshift_amount * (fig_height + 3)) if yshift else None,
+            )
 
     cmap_region = kwargs.get("cmap_region", region)
     show_region = kwargs.get("show_region", None)
@@ -358,6 +359,8 @@ def plot_grd(
     reverse_cpt = kwargs.get("reverse_cpt", False)
     colorbar = kwargs.get("colorbar", True)
     shp_mask = kwargs.get("shp_mask", None)
+    color_model = kwargs.get("color_model", "R")
+    categorical = kwargs.get("categorical", False)
 
     if kwargs.get("imagery_basemap", False) is True:
         fig.grdimage(  # type: ignore[union-attr]
@@ -380,11 +383,11 @@ def plot_grd(
         )
         colorbar = False
     elif grd2cpt is True:
-        if cpt_lims is None and isinstance(grid, (xr.DataArray)):
+        if cpt_lims is None:
+            # load a grid file once, and re-use it for grd2cpt and grdimage below
+            if isinstance(grid, str):
+                grid = xr.load_dataarray(grid)
             zmin, zmax = utils.get_min_max(grid, shp_mask, robust=robust)
-        elif cpt_lims is None and isinstance(grid, (str)):
-            with xr.load_dataarray(grid) as da:
-                zmin, zmax = utils.get_min_max(da, shp_mask, robust=robust)
         else:
             zmin, zmax = cpt_lims
         pygmt.grd2cpt(
@@ -394,8 +397,8 @@ def plot_grd(
             background=True,
             limit=(zmin, zmax),
             continuous=kwargs.get("continuous", True),
-            color_model=kwargs.get("color_model", "R"),
-            categorical=kwargs.get("categorical", False),
+            color_model=color_model,
+            categorical=categorical,
             reverse=reverse_cpt,
             verbose="e",
         )
@@ -407,8 +410,8 @@ def plot_grd(
                 series=(zmin, zmax),
                 background=True,
                 continuous=kwargs.get("continuous", False),
-                color_model=kwargs.get("color_model", "R"),
-                categorical=kwargs.get("categorical", False),
+                color_model=color_model,
+                categorical=categorical,
                 reverse=reverse_cpt,
                 verbose="e",
             )
@@ -417,18 +420,17 @@ def plot_grd(
                 cmap=cmap,
                 background=True,
                 continuous=kwargs.get("continuous", False),
-                color_model=kwargs.get("color_model", "R"),
-                categorical=kwargs.get("categorical", False),
+                color_model=color_model,
+                categorical=categorical,
                 reverse=reverse_cpt,
                 verbose="e",
             )
     else:
         try:
-            if isinstance(grid, (xr.DataArray)):
-                zmin, zmax = utils.get_min_max(grid, shp_mask, robust=robust)
-            else:
-                with xr.load_dataarray(grid) as da:
-                    zmin, zmax = utils.get_min_max(da, shp_mask, robust=robust)
+            # load a grid file once, and re-use it for grdimage below
+            if isinstance(grid, str):
+                grid = xr.load_dataarray(grid)
+            zmin, zmax = utils.get_min_max(grid, shp_mask, robust=robust)
             pygmt.makecpt(
                 cmap=cmap,
                 background=True,
@@ -462,8 +464,6 @@ def plot_grd(
         verbose="q",
     )
 
-    cmap_region = kwargs.get("cmap_region", region)
-
     # add datapoints
     if points is not None:
         fig.plot(  # type: ignore[union-attr]
@@ -518,12 +518,7 @@ def plot_grd(
     if inset is True:
         # removed duplicate kwargs before passing to add_inset
         new_kwargs = {
-            key: value
-            for key, value in kwargs.items()
-            if key
-            not in [
-                "fig",
-            ]
+            key: value for key, value in kwargs.items() if key not in _INSET_EXCLUDE
         }
         add_inset(
             fig,
@@ -557,16 +552,7 @@ def plot_grd(
     if colorbar is True:
         # removed duplicate kwargs before passing to add_colorbar
         cbar_kwargs = {
-            key: value
-            for key, value in kwargs.items()
-            if key
-            not in [
-                "cpt_lims",
-                "fig_width",
-                "hist",
-                "grid",
-                "fig",
-            ]
+            key: value for key, value in kwargs.items() if key not in _CBAR_EXCLUDE
         }
         add_colorbar(
             fig,
@@ -609,17 +595,17 @@ def add_colorbar(
         colormap. If not supplied, will attempt to get values from kwargs `grid`, by
         default None
     """
-    # get the current figure width
-    fig_width = utils.get_fig_width()
+    # use the supplied figure width, otherwise get the current figure width
+    fig_width = kwargs.get("fig_width", None)
+    if fig_width is None:
+        fig_width = utils.get_fig_width()
 
     # set colorbar width as percentage of total figure width
     cbar_width_perc = kwargs.get("cbar_width_perc", 0.8)
 
     # if plotting a histogram add 2cm of spacing instead of .2cm
-    if hist is True:
-        cbar_yoffset = kwargs.get("cbar_yoffset", 2)
-    else:
-        cbar_yoffset = kwargs.get("cbar_yoffset", 0.2)
+    cbar_yoffset = kwargs.get("cbar_yoffset", 2 if hist is True else 0.2)
+    cbar_xoffset = kwargs.get("cbar_xoffset", 0)
 
     if cbar_frame is None:
         cbar_frame = [
@@ -642,7 +628,7 @@ def add_colorbar(
             cmap=kwargs.get("cmap", True),
             position=(
                 f"jBC+w{fig_width*cbar_width_perc}c+jTC+{orientation}{text_location}"
-                f"+o{kwargs.get('cbar_xoffset', 0)}c/{cbar_yoffset}c+e"
+                f"+o{cbar_xoffset}c/{cbar_yoffset}c+e"
             ),
             frame=cbar_frame,
             scale=kwargs.get("cbar_scale", 1),
@@ -754,7 +740,7 @@ def add_colorbar(
         ]
 
         # shift figure to line up with top left of cbar
-        xshift = kwargs.get("cbar_xoffset", 0) + ((1 - cbar_width_perc) * fig_width) / 2
+        xshift = cbar_xoffset + ((1 - cbar_width_perc) * fig_width) / 2
         try:
             fig.shift_origin(xshift=f"{xshift}c", yshift=f"-{cbar_yoffset}c")
         except pygmt.exceptions.GMTCLibError as e:
@@ -793,6 +779,28 @@ def add_colorbar(
             logging.warning("issue with plotting histogram, skipping...")
 
 
+@functools.lru_cache(maxsize=8)
+def _load_coast(version: str, no_coast: bool) -> gpd.GeoDataFrame:
+    """
+    Read the groundingline and coastline shapes for `add_coast`, cached so they're only
+    read once for all the figures and subplots.
+    """
+    if version == "depoorter-2013":
+        gdf = gpd.read_file(fetch.groundingline(version=version))
+        if no_coast is False:
+            data = gdf
+        elif no_coast is True:
+            data = gdf[gdf.Id_text == "Grounded ice or land"]
+    elif version == "measures-v2":
+        gl = gpd.read_file(fetch.groundingline(version=version))
+        if no_coast is False:
+            coast = gpd.read_file(fetch.measures_boundaries(version="Coastline"))
+            data = pd.concat([gl, coast])
+        elif no_coast is True:
+            data = gl
+    return data
+
+
 def add_coast(
     fig: pygmt.Figure,
     region: tuple[float, float, float, float] | None = None,
@@ -819,22 +827,8 @@ def add_coast(
     if pen is None:
         pen = "0.6p,black"
 
-    if version == "depoorter-2013":
-        gdf = gpd.read_file(fetch.groundingline(version=version))
-        if no_coast is False:
-            data = gdf
-        elif no_coast is True:
-            data = gdf[gdf.Id_text == "Grounded ice or land"]
-    elif version == "measures-v2":
-        gl = gpd.read_file(fetch.groundingline(version=version))
-        if no_coast is False:
-            coast = gpd.read_file(fetch.measures_boundaries(version="Coastline"))
-            data = pd.concat([gl, coast])
-        elif no_coast is True:
-            data = gpd.read_file(fetch.groundingline(version=version))
-
     fig.plot(
-        data,
+        _load_coast(version, no_coast),
         projection=projection,
         region=region,
         pen=pen,
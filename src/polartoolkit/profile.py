@@ -8,21 +8,20 @@
 # pylint: disable=too-many-lines
 from __future__ import annotations
 
+import functools
 import logging
 import typing
 
 import numpy as np
 import pandas as pd
-import pygmt
 import pyogrio
-import verde as vd
 import xarray as xr
+from scipy.interpolate import CubicSpline
 
-# import polartoolkit.fetch as fetch
-from polartoolkit import fetch, maps, utils
-
-# import polartoolkit.maps as maps
-# import polartoolkit.utils as utils
+# pygmt and the fetch, maps, and utils modules are slow to import and are only needed
+# for sampling and plotting, so are imported within the functions which use them
+if typing.TYPE_CHECKING:
+    import pygmt
 
 try:
     from IPython.display import display
@@ -81,13 +80,17 @@ def create_profile(
             raise ValueError(msg)
         start = typing.cast(tuple[float, float], start)
         stop = typing.cast(tuple[float, float], stop)
+        # build each column from its own array so columns are stored contiguously
         coordinates = pd.DataFrame(
-            data=np.linspace(start=start, stop=stop, num=num), columns=["x", "y"]
+            {
+                "x": np.linspace(start=start[0], stop=stop[0], num=num),
+                "y": np.linspace(start=start[1], stop=stop[1], num=num),
+            }
         )
         # for points, dist is from first point
-        coordinates["dist"] = np.sqrt(
-            (coordinates.x - coordinates.x.iloc[0]) ** 2
-            + (coordinates.y - coordinates.y.iloc[0]) ** 2
+        coordinates["dist"] = np.hypot(
+            coordinates.x.to_numpy() - start[0],
+            coordinates.y.to_numpy() - start[1],
         )
 
     elif method == "shapefile":
@@ -95,9 +98,15 @@ def create_profile(
             msg = f"If method = {method}, need to provide a valid shapefile"
             raise ValueError(msg)
         shp = pyogrio.read_dataframe(shapefile)
-        df = pd.DataFrame()
-        df["coords"] = shp.geometry[0].coords[:]
-        coordinates_rel = df.coords.apply(pd.Series, index=["x", "y"])
+        # build x, y columns straight from the vertex array, dropping any z values,
+        # with each column stored contiguously
+        vertices = np.asarray(shp.geometry[0].coords, dtype=np.float64)
+        coordinates_rel = pd.DataFrame(
+            {
+                "x": np.ascontiguousarray(vertices[:, 0]),
+                "y": np.ascontiguousarray(vertices[:, 1]),
+            }
+        )
         # for shapefiles, dist is cumulative from previous points
         coordinates = cum_dist(coordinates_rel, **kwargs)
 
@@ -108,40 +117,116 @@ def create_profile(
         # for shapefiles, dist is cumulative from previous points
         coordinates = cum_dist(polyline, **kwargs)
 
-    coords = coordinates.sort_values(by=["dist"])
-
-    if method in ["shapefile", "polyline"]:
-        try:
-            if num is not None:
-                df = coords.set_index("dist")
-                dist_resampled = np.linspace(
-                    coords.dist.min(),
-                    coords.dist.max(),
-                    num,
-                    dtype=float,
-                )
-                df1 = (
-                    df.reindex(df.index.union(dist_resampled))
-                    .interpolate("cubic")  # cubic needs at least 4 points
-                    .reset_index()
-                )
-                df2 = df1[df1.dist.isin(dist_resampled)]
-            else:
-                df2 = coords
-        except ValueError:
-            logging.info(
-                (
-                    "Issue with resampling, possibly due to number of points, ",
-                    "you must provide at least 4 points. Returning unsampled points",
-                )
-            )
-            df2 = coords
+    # distances from linspace or cumulative sums are already sorted, so only sort
+    # when needed
+    if method == "points" or coordinates.dist.is_monotonic_increasing:
+        coords = coordinates
     else:
+        coords = coordinates.sort_values(by=["dist"])
+
+    # no resampling needed for points, if num isn't set, or if the points are
+    # already evenly spaced at the requested number
+    if (
+        (method == "points")
+        or (num is None)
+        or (num == len(coords) and np.allclose(np.diff(coords.dist.to_numpy(), 2), 0))
+    ):
+        return coords[["x", "y", "dist"]].reset_index(drop=True)
+
+    try:
+        dist_resampled = np.linspace(
+            coords.dist.min(),
+            coords.dist.max(),
+            num,
+            dtype=float,
+        )
+        # fit a cubic spline to x and y as a function of distance and
+        # evaluate it at the resampled distances
+        spline = CubicSpline(
+            coords.dist.to_numpy(),
+            coords[["x", "y"]].to_numpy(),
+            axis=0,
+        )
+        xy = spline(dist_resampled)
+        df2 = pd.DataFrame({"x": xy[:, 0], "y": xy[:, 1], "dist": dist_resampled})
+    except ValueError:
+        logging.info(
+            (
+                "Issue with resampling, possibly due to number of points or ",
+                "repeated vertices. Returning unsampled points",
+            )
+        )
         df2 = coords
 
     return df2[["x", "y", "dist"]].reset_index(drop=True)
 
 
+def _sample_grid(
+    points: pd.DataFrame,
+    grid: str | xr.DataArray,
+    name: str,
+    **kwargs: typing.Any,
+) -> typing.Any:
+    """
+    Sample a grid at the x,y points with pygmt.grdtrack, returning an array of values
+    in the same order.
+    """
+    import pygmt  # pylint: disable=import-outside-toplevel
+
+    x, y = points.columns[:2]
+
+    if isinstance(grid, xr.DataArray):
+        # only pass the part of the grid around the points to GMT
+        grid = _crop_to_points(grid, points[x].to_numpy(), points[y].to_numpy())
+
+    sampled = pygmt.grdtrack(
+        points=points,
+        grid=grid,
+        newcolname=name,
+        # radius=kwargs.get("radius", None),
+        no_skip=True,  # if false causes issues
+        verbose=kwargs.get("verbose", "w"),
+        interpolation=kwargs.get("interpolation", "c"),
+    )
+    return sampled[name].to_numpy()
+
+
+def _crop_to_points(
+    grid: xr.DataArray,
+    x: typing.Any,
+    y: typing.Any,
+    pad: int = 4,
+) -> xr.DataArray:
+    """
+    Subset a grid to the bounding box of the points plus a few cells of padding. GMT's
+    bicubic and B-spline interpolation use the 2 nodes on either side of a point, and
+    GMT fills 2 boundary rows around a grid from its boundary conditions, so a pad of
+    4 nodes keeps those boundary rows out of the stencil of every point and the
+    sampled values match those from the full grid. Where the points are near the
+    edge of the grid, the crop keeps the grid's own edge. If the points aren't all
+    within the grid's coordinates (e.g. for wrapping longitudes), the full grid is
+    returned.
+    """
+    y_dim, x_dim = grid.dims[-2:]
+    slices = {}
+    for dim, vals in ((x_dim, x), (y_dim, y)):
+        coords = grid[dim].to_numpy()
+        if len(coords) < 2:
+            return grid
+        lo, hi = np.nanmin(vals), np.nanmax(vals)
+        if (lo < coords.min()) or (hi > coords.max()):
+            return grid
+        # coordinates may be ascending or descending
+        ascending = coords[-1] > coords[0]
+        ordered = coords if ascending else coords[::-1]
+        start = max(np.searchsorted(ordered, lo, side="right") - 1 - pad, 0)
+        stop = min(np.searchsorted(ordered, hi, side="left") + 1 + pad, len(coords))
+        if not ascending:
+            start, stop = len(coords) - stop, len(coords) - start
+        slices[dim] = slice(start, stop)
+    return grid.isel(slices)
+
+
 def sample_grids(
     df: pd.DataFrame,
     grid: str | xr.DataArray,
@@ -161,50 +246,98 @@ def sample_grids(
     sampled_name : str,
         Name for sampled column
 
+    Keyword Args
+    ------------
+    verify : bool
+        check that the returned dataframe is identical to the input except for the
+        new column, raising an AssertionError if not, by default False
+
     Returns
     -------
     pd.DataFrame
         Dataframe with new column (sampled_name) of sample values from (grid)
     """
 
-    # drop name column if it already exists
-    try:
-        df1 = df.drop(columns=sampled_name)
-    except KeyError:
-        df1 = df.copy()
+    # drop name column if it already exists, this returns a new dataframe
+    df1 = df.drop(columns=sampled_name, errors="ignore")
 
-    df2 = df1.copy()
+    x, y = kwargs.get("coord_names", ("x", "y"))
+    # get points to sample at, with a default index so it matches grdtrack's output
+    points = pd.DataFrame({x: df1[x].to_numpy(), y: df1[y].to_numpy()})
+
+    # sample the grid at all x,y points, rows are returned in the same order, so
+    # assign by position, keeping the original index
+    df1[sampled_name] = _sample_grid(points, grid, sampled_name, **kwargs)
+
+    # optionally check that dataframe is identical to original except for new column
+    if kwargs.get("verify", False) is True:
+        pd.testing.assert_frame_equal(
+            df1.drop(columns=sampled_name),
+            df.drop(columns=sampled_name, errors="ignore"),
+        )
 
-    # reset the index
-    df3 = df2.reset_index()
+    return df1
+
+
+def sample_grids_many(
+    df: pd.DataFrame,
+    grids: dict[str, str | xr.DataArray],
+    **kwargs: typing.Any,
+) -> pd.DataFrame:
+    """
+    Sample multiple grids at every point along a line. The points are extracted once
+    and shared between each call to `pygmt.grdtrack`.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataframe containing columns 'x', 'y', or columns with names defined by kwarg
+        "coord_names".
+    grids : dict[str, str | xr.DataArray]
+        Dictionary with names for the sampled columns as keys and grids to sample,
+        either file names or xr.DataArrays, as values.
 
+    Returns
+    -------
+    pd.DataFrame
+        Dataframe with a new column of sampled values for each grid
+    """
     x, y = kwargs.get("coord_names", ("x", "y"))
+
+    # drop name columns if they already exist
+    df_out = df.drop(columns=list(grids), errors="ignore")
+
     # get points to sample at
-    points = df3[[x, y]].copy()
+    points = pd.DataFrame({x: df_out[x].to_numpy(), y: df_out[y].to_numpy()})
 
-    # sample the grid at all x,y points
-    sampled = pygmt.grdtrack(
-        points=points,
-        grid=grid,
-        newcolname=sampled_name,
-        # radius=kwargs.get("radius", None),
-        no_skip=True,  # if false causes issues
-        verbose=kwargs.get("verbose", "w"),
-        interpolation=kwargs.get("interpolation", "c"),
-    )
+    for name, grid in grids.items():
+        # sample the grid at all x,y points
+        df_out[name] = _sample_grid(points, grid, name, **kwargs)
 
-    df3[sampled_name] = sampled[sampled_name]
+    return df_out
 
-    # reset index to previous
-    df4 = df3.set_index("index")
 
-    # reset index name to be same as originals
-    df4.index.name = df1.index.name
+def _load_grid(grid: str | xr.DataArray) -> xr.DataArray:
+    """
+    Load a grid file into memory, or return the grid if it is already a DataArray.
+    """
+    if isinstance(grid, str):
+        return typing.cast(xr.DataArray, xr.load_dataarray(grid))
+    return grid
 
-    # check that dataframe is identical to original except for new column
-    pd.testing.assert_frame_equal(df4.drop(columns=sampled_name), df1)
 
-    return df4
+def _broadcast(val: typing.Any, n: int, default: typing.Any) -> list[typing.Any]:
+    """
+    Expand a kwarg given as a single value or a list into a list of length n, with
+    any None values replaced by the default. The default can also be a list of
+    length n, to give each item its own default.
+    """
+    defaults = default if isinstance(default, list) else [default] * n
+    if val is None:
+        return defaults
+    if not isinstance(val, list):
+        val = [val] * n
+    return [d if v is None else v for v, d in zip(val, defaults)]
 
 
 def fill_nans(df: pd.DataFrame) -> pd.DataFrame:
@@ -221,12 +354,13 @@ def fill_nans(df: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Dataframe with NaN's of lower layers filled
     """
-    cols = df.columns[3:].values
-    for i, j in enumerate(cols):
-        if i == 0:
-            pass
-        else:
-            df[j] = df[j].fillna(df[cols[i - 1]])
+    cols = df.columns[3:]
+    # forward fill across the layer columns on a single array instead of per column
+    arr = df[cols].to_numpy(dtype=float, copy=True)
+    for i in range(1, arr.shape[1]):
+        nans = np.isnan(arr[:, i])
+        arr[nans, i] = arr[nans, i - 1]
+    df[cols] = arr
     return df
 
 
@@ -254,10 +388,18 @@ def shorten(
         max_dist = df.dist.max()
     if min_dist is None:
         min_dist = df.dist.min()
-    shortened = df[(df.dist < max_dist) & (df.dist > min_dist)].copy()
-    shortened["dist"] = np.sqrt(
-        (shortened.x - shortened.x.iloc[0]) ** 2
-        + (shortened.y - shortened.y.iloc[0]) ** 2
+    if df.dist.is_monotonic_increasing:
+        # rows within the distances are a contiguous slice, find its ends with a
+        # binary search instead of masking every row
+        dist = df.dist.to_numpy()
+        lo = np.searchsorted(dist, min_dist, side="right")
+        hi = np.searchsorted(dist, max_dist, side="left")
+        shortened = df.iloc[lo:hi].copy()
+    else:
+        shortened = df[(df.dist < max_dist) & (df.dist > min_dist)].copy()
+    shortened["dist"] = np.hypot(
+        shortened.x.to_numpy() - shortened.x.iloc[0],
+        shortened.y.to_numpy() - shortened.y.iloc[0],
     )
     return shortened
 
@@ -289,51 +431,31 @@ def make_data_dict(
         Nested dictionaries of grids and attributes
     """
 
+    if axes is None:
+        axes = [0] * len(names)
+
+    # zip would silently drop entries if the lists have different lengths
+    if not len(names) == len(grids) == len(colors) == len(axes):
+        msg = "names, grids, colors, and axes must all have the same length."
+        raise ValueError(msg)
+
     return {
-        f"{i}": {
-            "name": j,
-            "grid": grids[i],
-            "color": colors[i],
-            "axis": axes[i] if axes is not None else 0,
-        }
-        for i, j in enumerate(names)
+        f"{i}": {"name": name, "grid": grid, "color": color, "axis": axis}
+        for i, (name, grid, color, axis) in enumerate(zip(names, grids, colors, axes))
     }
 
 
-def default_layers(
+def _fetch_default_layers(
     version: str,
-    reference: str | None = None,
-    region: tuple[float, float, float, float] | None = None,
-    spacing: float | None = None,
-    verbose: str = "q",
-) -> dict[str, dict[str, str | xr.DataArray]]:
+    reference: str | None,
+    region: tuple[float, float, float, float] | None,
+    spacing: float | None,
+    verbose: str,
+) -> tuple[typing.Any, typing.Any, typing.Any]:
     """
-    Fetch default ice surface, ice base, and bed layers.
-
-    Parameters
-    ----------
-    version : str
-        choose between 'bedmap2' and 'bedmachine' layers
-    reference : str, optional
-        choose between 'ellipsoid', 'eigen-6c4' or 'eigen-gl04c' (only for bedmap2),
-        for an elevation reference frame, by default None
-    region : tuple[float], optional
-        bounding region to subset grids by, by default None
-    spacing : float, optional
-        grid spacing to resample the grids to, by default None
-
-    Returns
-    -------
-    dict[str, dict[str, str | xr.DataArray]]
-        Nested dictionary of earth layers and attributes
+    Fetch the default layer grids.
     """
-
-    if (spacing is not None) or (reference is not None) or (region is not None):
-        logging.warning(
-            "Supplying any spacing, reference, or region to `default_layers` will "
-            "result in resampling of the grids, which will likely take longer than "
-            "just using the full-resolution defaults."
-        )
+    from polartoolkit import fetch  # pylint: disable=import-outside-toplevel
 
     if version == "bedmap2":
         if reference is None:
@@ -387,6 +509,48 @@ def default_layers(
             verbose=verbose,
         )
 
+    return surface, icebase, bed
+
+
+def default_layers(
+    version: str,
+    reference: str | None = None,
+    region: tuple[float, float, float, float] | None = None,
+    spacing: float | None = None,
+    verbose: str = "q",
+) -> dict[str, dict[str, str | xr.DataArray]]:
+    """
+    Fetch default ice surface, ice base, and bed layers.
+
+    Parameters
+    ----------
+    version : str
+        choose between 'bedmap2' and 'bedmachine' layers
+    reference : str, optional
+        choose between 'ellipsoid', 'eigen-6c4' or 'eigen-gl04c' (only for bedmap2),
+        for an elevation reference frame, by default None
+    region : tuple[float], optional
+        bounding region to subset grids by, by default None
+    spacing : float, optional
+        grid spacing to resample the grids to, by default None
+
+    Returns
+    -------
+    dict[str, dict[str, str | xr.DataArray]]
+        Nested dictionary of earth layers and attributes
+    """
+
+    if (spacing is not None) or (reference is not None) or (region is not None):
+        logging.warning(
+            "Supplying any spacing, reference, or region to `default_layers` will "
+            "result in resampling of the grids, which will likely take longer than "
+            "just using the full-resolution defaults."
+        )
+
+    surface, icebase, bed = _fetch_default_layers(
+        version, reference, region, spacing, verbose
+    )
+
     layer_names = [
         "ice",
         "water",
@@ -405,23 +569,26 @@ def default_layers(
     }
 
 
-def default_data(
-    region: tuple[float, float, float, float] | None = None,
-    verbose: str = "q",
-) -> dict[typing.Any, typing.Any]:
+@functools.lru_cache(maxsize=1)
+def _default_imagery() -> str:
     """
-    Fetch default gravity and magnetic datasets.
+    Get the file name of the default map background imagery, cached so it's only
+    fetched once.
+    """
+    from polartoolkit import fetch  # pylint: disable=import-outside-toplevel
 
-    Parameters
-    ----------
-    region : tuple[float, float, float, float], optional
-        bounding region to subset grids by, by default None
+    return fetch.imagery()
 
-    Returns
-    -------
-    dict[typing.Any, typing.Any]
-        Nested dictionary of data and attributes
+
+def _fetch_default_data(
+    region: tuple[float, float, float, float] | None,
+    verbose: str,
+) -> tuple[xr.DataArray, typing.Any]:
     """
+    Fetch the default data grids.
+    """
+    from polartoolkit import fetch  # pylint: disable=import-outside-toplevel
+
     mag = fetch.magnetics(
         version="admap1",
         region=region,
@@ -437,6 +604,29 @@ def default_data(
         # spacing=10e3,
         verbose=verbose,
     )
+
+    return mag, fa_grav
+
+
+def default_data(
+    region: tuple[float, float, float, float] | None = None,
+    verbose: str = "q",
+) -> dict[typing.Any, typing.Any]:
+    """
+    Fetch default gravity and magnetic datasets.
+
+    Parameters
+    ----------
+    region : tuple[float, float, float, float], optional
+        bounding region to subset grids by, by default None
+
+    Returns
+    -------
+    dict[typing.Any, typing.Any]
+        Nested dictionary of data and attributes
+    """
+    mag, fa_grav = _fetch_default_data(region, verbose)
+
     data_names = [
         "ADMAP-1 magnetics",
         "ANT-4d Free-air grav",
@@ -521,6 +711,10 @@ def plot_profile(
     path: str
         Filename for saving image, by default is None.
     """
+    import pygmt  # pylint: disable=import-outside-toplevel
+
+    from polartoolkit import maps, utils  # pylint: disable=import-outside-toplevel
+
     inset = kwargs.get("inset", True)
     subplot_orientation = kwargs.get("subplot_orientation", "horizontal")
     gridlines = kwargs.get("gridlines", True)
@@ -535,7 +729,7 @@ def plot_profile(
         # with redirect_stdout(None), redirect_stderr(None):
         layers_dict = default_layers(
             layers_version,
-            # region=vd.get_region((points.x, points.y)),
+            # region=_region_from_xy(points),
             reference=kwargs.get("default_layers_reference", None),
             spacing=kwargs.get("default_layers_spacing", None),
         )
@@ -543,23 +737,24 @@ def plot_profile(
     # create default data dictionary
     if data_dict == "default":
         # with redirect_stdout(None), redirect_stderr(None):
-        data_dict = default_data(region=vd.get_region((points.x, points.y)))
+        data_dict = default_data(region=_region_from_xy(points))
 
-    # sample cross-section layers from grids
-    df_layers = points.copy()
-    for k, v in layers_dict.items():
-        df_layers = sample_grids(df_layers, v["grid"], sampled_name=k)
+    # sample cross-section layers from grids, grid files are loaded only once
+    df_layers = sample_grids_many(
+        points, {k: _load_grid(v["grid"]) for k, v in layers_dict.items()}
+    )
 
     # fill layers with above layer's values
     if kwargs.get("fillnans", True) is True:
         df_layers = fill_nans(df_layers)
 
-    # sample data grids
-    df_data = points.copy()
+    # sample data grids, sample_grids_many returns a new dataframe so points doesn't
+    # need to be copied
+    df_data = points
     if data_dict is not None:
-        points = points[["x", "y", "dist"]].copy()
-        for k, v in data_dict.items():
-            df_data = sample_grids(df_data, v["grid"], sampled_name=k)
+        df_data = sample_grids_many(
+            points, {k: _load_grid(v["grid"]) for k, v in data_dict.items()}
+        )
 
     # shorten profiles
     if kwargs.get("clip") is True:
@@ -583,8 +778,11 @@ def plot_profile(
 
     # PLOT CROSS SECTION AND DATA
     # get max and min of all the layers
-    layers_min = df_layers[df_layers.columns[3:]].min().min()
-    layers_max = df_layers[df_layers.columns[3:]].max().max()
+    # column-major, so each layer's values are contiguous
+    layers_arr = np.asfortranarray(
+        df_layers[list(layers_dict)].to_numpy(dtype=np.float64)
+    )
+    layers_min, layers_max = np.nanmin(layers_arr), np.nanmax(layers_arr)
     # add space above and below top and bottom of cross-section
     y_buffer = (layers_max - layers_min) * kwargs.get("layer_buffer", 0.1)
     # set region for x-section
@@ -604,17 +802,22 @@ def plot_profile(
         data_projection = f"X{fig_width}c/{data_height}c"
         layers_projection = f"X{fig_width}c/{layers_height}c"
 
-        # get axes from data dict
-        axes = pd.Series([v["axis"] for k, v in data_dict.items()])
+        # get keys and attributes from data dict once
+        data_keys = list(data_dict)
+        data_names = [v["name"] for v in data_dict.values()]
+        data_colors = [v["color"] for v in data_dict.values()]
+
+        # get axes from data dict, the first axis is 0 and any others are 1
+        axes = np.array([v["axis"] for v in data_dict.values()])
+        axis_ids = np.where(axes == axes[0], 0, 1)
 
         # for each axis get overall max and min values
-        ax0_min_max = []
-        ax1_min_max = []
-        for k, v in data_dict.items():
-            if v["axis"] == axes.unique()[0]:
-                ax0_min_max.append(utils.get_min_max(df_data[k]))
-            else:
-                ax1_min_max.append(utils.get_min_max(df_data[k]))
+        # column-major, so each data's values are contiguous
+        data_arr = np.asfortranarray(df_data[data_keys].to_numpy(dtype=np.float64))
+        axis_min_max: dict[int, tuple[float, float]] = {}
+        for ax in np.unique(axis_ids):
+            ax_data = data_arr[:, axis_ids == ax]
+            axis_min_max[ax] = (np.nanmin(ax_data), np.nanmax(ax_data))
 
         frames = kwargs.get("data_frame", None)
 
@@ -623,85 +826,81 @@ def plot_profile(
         elif isinstance(frames, list) and isinstance(frames[0], str):
             frames = [frames]
 
-        for i, (k, v) in enumerate(data_dict.items()):
-            if v["axis"] == axes.unique()[0]:
-                data_min = np.min([a for (a, b) in ax0_min_max])
-                data_max = np.max([b for (a, b) in ax0_min_max])
-
-                if frames[0] is None:
-                    frame = [
-                        "neSW",
-                        f"xag+l{kwargs.get('data_x_label',' ')}",
-                        f"yag+l{kwargs.get('data_y0_label',' ')}",
-                    ]
-                else:
-                    frame = frames[0]
-            else:
-                data_min = next(np.min(a) for (a, b) in ax1_min_max)
-                data_max = next(np.max(b) for (a, b) in ax1_min_max)
-                try:
-                    if frames[1] is None:
-                        frame = [
-                            "nEsw",
-                            f"ya+l{kwargs.get('data_y1_label',' ')}",
-                        ]
-                    else:
-                        frame = frames[1]
-                except IndexError:
-                    frame = [
-                        "nEsw",
-                        f"ya+l{kwargs.get('data_y1_label',' ')}",
-                    ]
+        # get the frames for each axis, using the labels if no frames are given
+        if frames[0] is None:
+            frame_ax0 = [
+                "neSW",
+                f"xag+l{kwargs.get('data_x_label',' ')}",
+                f"yag+l{kwargs.get('data_y0_label',' ')}",
+            ]
+        else:
+            frame_ax0 = frames[0]
+        if len(frames) > 1 and frames[1] is not None:
+            frame_ax1 = frames[1]
+        else:
+            frame_ax1 = [
+                "nEsw",
+                f"ya+l{kwargs.get('data_y1_label',' ')}",
+            ]
+
+        # get pen properties for each data line
+        n_data = len(data_keys)
+        data_thicks = _broadcast(kwargs.get("data_pen_thickness"), n_data, 1)
+        data_pen_colors = _broadcast(kwargs.get("data_pen_color"), n_data, data_colors)
+        data_styles = _broadcast(kwargs.get("data_pen_style"), n_data, "")
+        data_line_styles = _broadcast(kwargs.get("data_line_style"), n_data, None)
+        # use supplied pens, or build them from the pen properties
+        data_pens = _broadcast(
+            kwargs.get("data_pen"),
+            n_data,
+            [
+                f"{t}p,{c},{st}"
+                for t, c, st in zip(data_thicks, data_pen_colors, data_styles)
+            ],
+        )
+
+        # get distances as an array, the data values are the columns of data_arr
+        data_dist = df_data.dist.to_numpy()
+        dist_min, dist_max = np.nanmin(data_dist), np.nanmax(data_dist)
+
+        # get kwargs used in the plotting loop
+        data_line_cmap = kwargs.get("data_line_cmap", None)
+        data_buffer = kwargs.get("data_buffer", 0.1)
+        data_cmap_thicks = kwargs.get("data_pen", [1] * n_data)
+
+        # make the colormap for the data lines once
+        if data_line_cmap is not None:
+            pygmt.makecpt(
+                cmap=data_line_cmap,
+                series=[np.min(data_colors), np.max(data_colors)],
+            )
+
+        for i in range(n_data):
+            data_min, data_max = axis_min_max[axis_ids[i]]
+            frame = frame_ax0 if axis_ids[i] == 0 else frame_ax1
             # add space above and below top and bottom of graph
-            y_buffer = (data_max - data_min) * kwargs.get("data_buffer", 0.1)
+            y_buffer = (data_max - data_min) * data_buffer
 
             # set region for data
             data_reg = [
-                df_data.dist.min(),
-                df_data.dist.max(),
+                dist_min,
+                dist_max,
                 data_min - y_buffer,
                 data_max + y_buffer,
             ]
 
             # plot data
-            if kwargs.get("data_line_cmap", None) is None:
+            if data_line_cmap is None:
                 # plot data as lines
-                data_pen = kwargs.get("data_pen")
-                if isinstance(data_pen, list):
-                    data_pen = data_pen[i]
-                if data_pen is not None:
-                    pen = data_pen
-                else:
-                    thick = kwargs.get("data_pen_thickness", 1)
-                    if isinstance(thick, (float, int)):
-                        thick = [thick] * len(data_dict.items())
-
-                    color = kwargs.get("data_pen_color", None)
-                    if isinstance(color, list):
-                        color = color[i]
-                    if color is None:
-                        color = v["color"]
-
-                    style = kwargs.get("data_pen_style", None)
-                    if isinstance(style, list):
-                        style = style[i]
-                    if style is None:
-                        style = ""
-                pen = f"{thick[i]}p,{color},{style}"
-
-                data_line_style = kwargs.get("data_line_style", None)
-                if isinstance(data_line_style, list):
-                    data_line_style = data_line_style[i]
-
                 fig.plot(
                     region=data_reg,
                     projection=data_projection,
                     frame=frame,
-                    x=df_data.dist,
-                    y=df_data[k],
-                    pen=pen,
-                    style=data_line_style,
-                    label=v["name"],
+                    x=data_dist,
+                    y=data_arr[:, i],
+                    pen=data_pens[i],
+                    style=data_line_styles[i],
+                    label=data_names[i],
                 )
                 # fig.plot(
                 #     region=data_reg,
@@ -713,24 +912,16 @@ def plot_profile(
                 #     label = v["name"],
                 # )
             else:
-                pygmt.makecpt(
-                    cmap=kwargs.get("data_line_cmap"),
-                    series=[
-                        np.min([v["color"] for k, v in data_dict.items()]),
-                        np.max([v["color"] for k, v in data_dict.items()]),
-                    ],
-                )
-
                 fig.plot(
                     region=data_reg,
                     projection=data_projection,
                     frame=frame,
-                    x=df_data.dist,
-                    y=df_data[k],
-                    pen=f"{kwargs.get('data_pen', [1]*len(data_dict.items()))[i]}p,+z",
-                    label=v["name"],
+                    x=data_dist,
+                    y=data_arr[:, i],
+                    pen=f"{data_cmap_thicks[i]}p,+z",
+                    label=data_names[i],
                     cmap=True,
-                    zvalue=v["color"],
+                    zvalue=data_colors[i],
                 )
         with pygmt.config(
             FONT_ANNOT_PRIMARY=kwargs.get("data_legend_font", "10p,Helvetica,black"),
@@ -742,7 +933,7 @@ def plot_profile(
                     S=kwargs.get("data_legend_scale", 1),
                 )
 
-        if kwargs.get("data_line_cmap", None) is not None:
+        if data_line_cmap is not None:
             fig.colorbar(
                 cmap=True,
                 frame=f"a+l{kwargs.get('data_line_cmap_label', ' ')}",
@@ -767,118 +958,98 @@ def plot_profile(
         )
         layers_height = fig_height - 0.5
 
+    # get keys and attributes from layers dict once
+    layers_keys = list(layers_dict)
+    layers_names = [v["name"] for v in layers_dict.values()]
+    layers_colors = [v["color"] for v in layers_dict.values()]
+
+    # get kwargs used in the plotting loop
+    fill_layers = kwargs.get("fill_layers", True)
+    layers_line_cmap = kwargs.get("layers_line_cmap", None)
+    layers_line_frame = kwargs.get("layers_frame", ["nSew", "a"])
+    layers_transparency = kwargs.get("layer_transparency", [0] * len(layers_keys))
+    layers_cmap_thicks = kwargs.get("layer_pen", [1] * len(layers_keys))
+
+    # get pen properties for each layer, with black lines between filled layers
+    n_layers = len(layers_keys)
+    layers_thicks = _broadcast(kwargs.get("layers_pen_thickness"), n_layers, 1)
+    layers_pen_colors = _broadcast(
+        kwargs.get("layers_pen_color"),
+        n_layers,
+        "black" if fill_layers is True else layers_colors,
+    )
+    layers_styles = _broadcast(kwargs.get("layers_pen_style"), n_layers, "")
+    layers_line_styles = _broadcast(kwargs.get("layers_line_style"), n_layers, None)
+    # use supplied pens, or build them from the pen properties
+    layers_pens = _broadcast(
+        kwargs.get("layers_pen"),
+        n_layers,
+        [
+            f"{t}p,{c},{st}"
+            for t, c, st in zip(layers_thicks, layers_pen_colors, layers_styles)
+        ],
+    )
+
+    # get distances as an array, the layer values are the columns of layers_arr
+    layers_dist = df_layers.dist.to_numpy()
+
+    # make the colormap for the layer lines once
+    if (fill_layers is not True) and (layers_line_cmap is not None):
+        pygmt.makecpt(
+            cmap=layers_line_cmap,
+            series=[np.min(layers_colors), np.max(layers_colors)],
+        )
+
     # plot colored df_layers
-    for i, (k, v) in enumerate(layers_dict.items()):
+    for i in range(n_layers):
         # fill in layers and draw lines between
-        if kwargs.get("fill_layers", True) is True:
+        if fill_layers is True:
             fig.plot(
-                x=df_layers.dist,
-                y=df_layers[k],
+                x=layers_dist,
+                y=layers_arr[:, i],
                 close="+yb",  # close the polygons,
-                fill=v["color"],
-                frame=kwargs.get("layers_frame", ["nSew", "a"]),
-                transparency=kwargs.get(
-                    "layer_transparency", [0] * len(layers_dict.items())
-                )[i],
+                fill=layers_colors[i],
+                frame=layers_line_frame,
+                transparency=layers_transparency[i],
             )
             # plot lines between df_layers
-            layers_pen = kwargs.get("layers_pen")
-            if isinstance(layers_pen, list):
-                layers_pen = layers_pen[i]
-            # if pen properties supplied, use then
-            if layers_pen is not None:
-                pen = layers_pen
-            # if not, get pen properties from kwargs
-            else:
-                thick = kwargs.get("layers_pen_thickness", 1)
-                if isinstance(thick, (float, int)):
-                    thick = [thick] * len(layers_dict.items())
-
-                color = kwargs.get("layers_pen_color", None)
-                if isinstance(color, list):
-                    color = color[i]
-                if color is None:
-                    color = "black"
-
-                style = kwargs.get("layers_pen_style", None)
-                if isinstance(style, list):
-                    style = style[i]
-                if style is None:
-                    style = ""
-                pen = f"{thick[i]}p,{color},{style}"
-
-            layers_line_style = kwargs.get("layers_line_style", None)
-            if isinstance(layers_line_style, list):
-                layers_line_style = layers_line_style[i]
-            # plot lines between df_layers
             fig.plot(
-                x=df_layers.dist,
-                y=df_layers[k],
-                pen=pen,
-                style=layers_line_style,
+                x=layers_dist,
+                y=layers_arr[:, i],
+                pen=layers_pens[i],
+                style=layers_line_styles[i],
             )
             # plot transparent lines to get legend
             fig.plot(
-                x=df_layers.dist,
-                y=df_layers[k],
-                pen=f"5p,{v['color']}",
-                label=v["name"],
+                x=layers_dist,
+                y=layers_arr[:, i],
+                pen=f"5p,{layers_colors[i]}",
+                label=layers_names[i],
                 transparency=100,
             )
         # dont fill layers, just draw lines
         else:
-            if kwargs.get("layers_line_cmap", None) is None:
-                # get pen properties
-                layers_pen = kwargs.get("layers_pen")
-                if isinstance(layers_pen, list):
-                    layers_pen = layers_pen[i]
-                if layers_pen is not None:
-                    pen = layers_pen
-                else:
-                    thick = kwargs.get("layers_pen_thickness", 1)
-                    if isinstance(thick, (float, int)):
-                        thick = [thick] * len(layers_dict.items())
-
-                    color = kwargs.get("layers_pen_color", None)
-                    if isinstance(color, list):
-                        color = color[i]
-                    if color is None:
-                        color = v["color"]
-
-                    style = kwargs.get("layers_pen_style", None)
-                    if isinstance(style, list):
-                        style = style[i]
-                    if style is None:
-                        style = ""
-                    pen = f"{thick[i]}p,{color},{style}"
-
+            if layers_line_cmap is None:
                 fig.plot(
-                    x=df_layers.dist,
-                    y=df_layers[k],
+                    x=layers_dist,
+                    y=layers_arr[:, i],
                     # pen = f"{kwargs.get('layer_pen', [1]*len(layers_dict.items()))[i]}p,{v['color']}", # noqa: E501
-                    pen=pen,
-                    frame=kwargs.get("layers_frame", ["nSew", "a"]),
-                    label=v["name"],
+                    pen=layers_pens[i],
+                    frame=layers_line_frame,
+                    label=layers_names[i],
                 )
             else:
-                pygmt.makecpt(
-                    cmap=kwargs.get("layers_line_cmap"),
-                    series=[
-                        np.min([v["color"] for k, v in layers_dict.items()]),
-                        np.max([v["color"] for k, v in layers_dict.items()]),
-                    ],
-                )
                 fig.plot(
-                    x=df_layers.dist,
-                    y=df_layers[k],
-                    pen=f"{kwargs.get('layer_pen', [1]*len(layers_dict.items()))[i]}p,+z",  # noqa: E501
-                    frame=kwargs.get("layers_frame", ["nSew", "a"]),
+                    x=layers_dist,
+                    y=layers_arr[:, i],
+                    pen=f"{layers_cmap_thicks[i]}p,+z",
+                    frame=layers_line_frame,
                     # label=v["name"],
                     cmap=True,
-                    zvalue=v["color"],
+                    zvalue=layers_colors[i],
                 )
 
-    if kwargs.get("layers_line_cmap", None) is not None:
+    if layers_line_cmap is not None:
         fig.colorbar(
             cmap=True,
             frame=f"a+l{kwargs.get('layers_line_cmap_label', ' ')}",
@@ -942,9 +1113,7 @@ def plot_profile(
     if add_map is True:
         # Automatic data extent + buffer as % of line length
         buffer = df_layers.dist.max() * kwargs.get("map_buffer", 0.3)
-        map_reg = utils.alter_region(
-            vd.get_region((df_layers.x, df_layers.y)), buffer=buffer
-        )[1]
+        map_reg = utils.alter_region(_region_from_xy(df_layers), buffer=buffer)[1]
 
         # Set figure parameters
         if subplot_orientation == "horizontal":
@@ -975,12 +1144,16 @@ def plot_profile(
             msg = "invalid subplot_orientation string"
             raise ValueError(msg)
 
-        # plot imagery, or supplied grid as background
+        # plot imagery, or supplied grid as background, only fetching the imagery
+        # if no background is supplied
+        map_background = kwargs.get("map_background", None)
+        if map_background is None:
+            map_background = _default_imagery()
         # can't use maps.plot_grd because it reset projection
         if kwargs.get("map_grd2cpt", False) is True:
             pygmt.grd2cpt(
                 cmap=kwargs.get("map_cmap", "earth"),
-                grid=kwargs.get("map_background", fetch.imagery()),
+                grid=map_background,
                 region=map_reg,
                 background=True,
                 continuous=True,
@@ -992,7 +1165,7 @@ def plot_profile(
         fig.grdimage(
             region=map_reg,
             projection=map_proj,
-            grid=kwargs.get("map_background", fetch.imagery()),
+            grid=map_background,
             shading=kwargs.get("map_shading", False),
             cmap=cmap,
             verbose="q",
@@ -1027,19 +1200,13 @@ def plot_profile(
             y=df_layers.y,
             pen=kwargs.get("map_line_pen", "2p,red"),
         )
+        # get the start and end points of the profile
+        (start_x, start_y), (end_x, end_y) = _endpoints(df_layers)
+        # both labels share a style, so plot them together
         fig.text(
-            x=df_layers.loc[df_layers.dist.idxmin()].x,
-            y=df_layers.loc[df_layers.dist.idxmin()].y,
-            text=kwargs.get("start_label", "A"),
-            fill="white",
-            font="12p,Helvetica,black",
-            justify="CM",
-            clearance="+tO",
-        )
-        fig.text(
-            x=df_layers.loc[df_layers.dist.idxmax()].x,
-            y=df_layers.loc[df_layers.dist.idxmax()].y,
-            text=kwargs.get("end_label", "B"),
+            x=[start_x, end_x],
+            y=[start_y, end_y],
+            text=[kwargs.get("start_label", "A"), kwargs.get("end_label", "B")],
             fill="white",
             font="12p,Helvetica,black",
             justify="CM",
@@ -1132,6 +1299,10 @@ def plot_data(
     path: str
         Filename for saving image, by default is None.
     """
+    import pygmt  # pylint: disable=import-outside-toplevel
+
+    from polartoolkit import maps, utils  # pylint: disable=import-outside-toplevel
+
     inset = kwargs.get("inset", True)
     subplot_orientation = kwargs.get("subplot_orientation", "horizontal")
     gridlines = kwargs.get("gridlines", True)
@@ -1144,14 +1315,16 @@ def plot_data(
     # create default data dictionary
     if data_dict == "default":
         # with redirect_stdout(None), redirect_stderr(None):
-        data_dict = default_data(region=vd.get_region((points.x, points.y)))
+        data_dict = default_data(region=_region_from_xy(points))
 
-    # sample data grids
-    df_data = points.copy()
+    # sample data grids, sample_grids_many returns a new dataframe so points doesn't
+    # need to be copied
+    df_data = points
     if data_dict is not None:
-        points = points[["x", "y", "dist"]].copy()
-        for k, v in data_dict.items():
-            df_data = sample_grids(df_data, v["grid"], sampled_name=k)
+        # sample all data grids at the same points, grid files are loaded only once
+        df_data = sample_grids_many(
+            points, {k: _load_grid(v["grid"]) for k, v in data_dict.items()}
+        )
 
     # shorten profiles
     if kwargs.get("clip") is True:  # noqa: SIM102
@@ -1171,17 +1344,21 @@ def plot_data(
 
     data_projection = f"X{fig_width}c/{data_height}c"
 
-    # get axes from data dict
-    axes = pd.Series([v["axis"] for k, v in data_dict.items()])
-
-    # for each axis get overall max and min values
-    ax0_min_max = []
-    ax1_min_max = []
-    for k, v in data_dict.items():
-        if v["axis"] == axes.unique()[0]:
-            ax0_min_max.append(utils.get_min_max(df_data[k]))
-        else:
-            ax1_min_max.append(utils.get_min_max(df_data[k]))
+    # group data keys by axis, the first data's axis is the primary axis
+    data_items = list(data_dict.items())
+    axis_keys: dict[typing.Any, list[str]] = {}
+    for k, v in data_items:
+        axis_keys.setdefault(v["axis"], []).append(k)
+    axis0 = next(iter(axis_keys))
+
+    # for each axis get overall max and min values, reducing over all of the axis's
+    # data columns at once
+    ax0_arr = df_data[axis_keys[axis0]].to_numpy()
+    ax0_min, ax0_max = np.nanmin(ax0_arr), np.nanmax(ax0_arr)
+    ax1_keys = [k for ax, keys in axis_keys.items() if ax != axis0 for k in keys]
+    if ax1_keys:
+        ax1_arr = df_data[ax1_keys].to_numpy()
+        ax1_min, ax1_max = np.nanmin(ax1_arr), np.nanmax(ax1_arr)
 
     frames = kwargs.get("data_frame", None)
 
@@ -1190,103 +1367,104 @@ def plot_data(
     elif isinstance(frames, list) and isinstance(frames[0], str):
         frames = [frames]
 
-    for i, (k, v) in enumerate(data_dict.items()):
-        if v["axis"] == axes.unique()[0]:
-            data_min = np.min([a for (a, b) in ax0_min_max])
-            data_max = np.max([b for (a, b) in ax0_min_max])
-
-            if frames[0] is None:
-                frame = [
-                    "neSW",
-                    f"xag+l{kwargs.get('data_x_label',' ')}",
-                    f"yag+l{kwargs.get('data_y0_label',' ')}",
-                ]
-            else:
-                frame = frames[0]
+    # get the frames for each axis, using the labels if no frames are given
+    if frames[0] is None:
+        frame_ax0 = [
+            "neSW",
+            f"xag+l{kwargs.get('data_x_label',' ')}",
+            f"yag+l{kwargs.get('data_y0_label',' ')}",
+        ]
+    else:
+        frame_ax0 = frames[0]
+    if len(frames) > 1 and frames[1] is not None:
+        frame_ax1 = frames[1]
+    else:
+        frame_ax1 = [
+            "nEsw",
+            f"ya+l{kwargs.get('data_y1_label',' ')}",
+        ]
+
+    # get pen properties for each data line
+    n_data = len(data_dict)
+    data_thicks = _broadcast(kwargs.get("data_pen_thickness"), n_data, 1)
+    data_pen_colors = _broadcast(
+        kwargs.get("data_pen_color"),
+        n_data,
+        [v["color"] for v in data_dict.values()],
+    )
+    data_styles = _broadcast(kwargs.get("data_pen_style"), n_data, "")
+    data_line_styles = _broadcast(kwargs.get("data_line_style"), n_data, None)
+    # use supplied pens, or build them from the pen properties
+    data_pens = _broadcast(
+        kwargs.get("data_pen"),
+        n_data,
+        [
+            f"{t}p,{c},{st}"
+            for t, c, st in zip(data_thicks, data_pen_colors, data_styles)
+        ],
+    )
+
+    # get distances and data values as arrays, column-major so each data's values
+    # are contiguous
+    data_dist = df_data.dist.to_numpy()
+    dist_min, dist_max = np.nanmin(data_dist), np.nanmax(data_dist)
+    data_arr = np.asfortranarray(df_data[list(data_dict)].to_numpy(dtype=np.float64))
+
+    # get kwargs used in the plotting loop
+    data_line_cmap = kwargs.get("data_line_cmap", None)
+    data_buffer = kwargs.get("data_buffer", 0.1)
+    data_cmap_thicks = kwargs.get("data_pen", [1] * n_data)
+
+    # make the colormap for the data lines once
+    if data_line_cmap is not None:
+        pygmt.makecpt(
+            cmap=data_line_cmap,
+            series=[
+                np.min([v["color"] for v in data_dict.values()]),
+                np.max([v["color"] for v in data_dict.values()]),
+            ],
+        )
+
+    for i, v in enumerate(data_dict.values()):
+        if v["axis"] == axis0:
+            data_min, data_max = ax0_min, ax0_max
+            frame = frame_ax0
         else:
-            data_min = next(np.min(a) for (a, b) in ax1_min_max)
-            data_max = next(np.max(b) for (a, b) in ax1_min_max)
-            try:
-                if frames[1] is None:
-                    frame = [
-                        "nEsw",
-                        f"ya+l{kwargs.get('data_y1_label',' ')}",
-                    ]
-                else:
-                    frame = frames[1]
-            except IndexError:
-                frame = [
-                    "nEsw",
-                    f"ya+l{kwargs.get('data_y1_label',' ')}",
-                ]
+            data_min, data_max = ax1_min, ax1_max
+            frame = frame_ax1
         # add space above and below top and bottom of graph
-        y_buffer = (data_max - data_min) * kwargs.get("data_buffer", 0.1)
+        y_buffer = (data_max - data_min) * data_buffer
 
         # set region for data
         data_reg = [
-            df_data.dist.min(),
-            df_data.dist.max(),
+            dist_min,
+            dist_max,
             data_min - y_buffer,
             data_max + y_buffer,
         ]
 
         # plot data
-        if kwargs.get("data_line_cmap", None) is None:
+        if data_line_cmap is None:
             # plot data as lines
-            data_pen = kwargs.get("data_pen")
-            if isinstance(data_pen, list):
-                data_pen = data_pen[i]
-            if data_pen is not None:
-                pen = data_pen
-            else:
-                thick = kwargs.get("data_pen_thickness", 1)
-                if isinstance(thick, (float, int)):
-                    thick = [thick] * len(data_dict.items())
-
-                color = kwargs.get("data_pen_color", None)
-                if isinstance(color, list):
-                    color = color[i]
-                if color is None:
-                    color = v["color"]
-
-                style = kwargs.get("data_pen_style", None)
-                if isinstance(style, list):
-                    style = style[i]
-                if style is None:
-                    style = ""
-            pen = f"{thick[i]}p,{color},{style}"
-
-            data_line_style = kwargs.get("data_line_style", None)
-            if isinstance(data_line_style, list):
-                data_line_style = data_line_style[i]
-
             fig.plot(
                 region=data_reg,
                 projection=data_projection,
                 frame=frame,
-                x=df_data.dist,
-                y=df_data[k],
-                pen=pen,
-                style=data_line_style,
+                x=data_dist,
+                y=data_arr[:, i],
+                pen=data_pens[i],
+                style=data_line_styles[i],
                 label=v["name"],
             )
 
         else:
-            pygmt.makecpt(
-                cmap=kwargs.get("data_line_cmap"),
-                series=[
-                    np.min([v["color"] for k, v in data_dict.items()]),
-                    np.max([v["color"] for k, v in data_dict.items()]),
-                ],
-            )
-
             fig.plot(
                 region=data_reg,
                 projection=data_projection,
                 frame=frame,
-                x=df_data.dist,
-                y=df_data[k],
-                pen=f"{kwargs.get('data_pen', [1]*len(data_dict.items()))[i]}p,+z",
+                x=data_dist,
+                y=data_arr[:, i],
+                pen=f"{data_cmap_thicks[i]}p,+z",
                 label=v["name"],
                 cmap=True,
                 zvalue=v["color"],
@@ -1300,7 +1478,7 @@ def plot_data(
                 box=kwargs.get("data_legend_box", False),
                 S=kwargs.get("data_legend_scale", 1),
             )
-    if kwargs.get("data_line_cmap", None) is not None:
+    if data_line_cmap is not None:
         fig.colorbar(
             cmap=True,
             frame=f"a+l{kwargs.get('data_line_cmap_label', ' ')}",
@@ -1332,9 +1510,7 @@ def plot_data(
     if add_map is True:
         # Automatic data extent + buffer as % of line length
         buffer = df_data.dist.max() * kwargs.get("map_buffer", 0.3)
-        map_reg = utils.alter_region(
-            vd.get_region((df_data.x, df_data.y)), buffer=buffer
-        )[1]
+        map_reg = utils.alter_region(_region_from_xy(df_data), buffer=buffer)[1]
 
         # Set figure parameters
         if subplot_orientation == "horizontal":
@@ -1365,12 +1541,16 @@ def plot_data(
             msg = "invalid subplot_orientation string"
             raise ValueError(msg)
 
-        # plot imagery, or supplied grid as background
+        # plot imagery, or supplied grid as background, only fetching the imagery
+        # if no background is supplied
+        map_background = kwargs.get("map_background", None)
+        if map_background is None:
+            map_background = _default_imagery()
         # can't use maps.plot_grd because it reset projection
         if kwargs.get("map_grd2cpt", False) is True:
             pygmt.grd2cpt(
                 cmap=kwargs.get("map_cmap", "earth"),
-                grid=kwargs.get("map_background", fetch.imagery()),
+                grid=map_background,
                 region=map_reg,
                 background=True,
                 continuous=True,
@@ -1382,7 +1562,7 @@ def plot_data(
         fig.grdimage(
             region=map_reg,
             projection=map_proj,
-            grid=kwargs.get("map_background", fetch.imagery()),
+            grid=map_background,
             shading=kwargs.get("map_shading", False),
             cmap=cmap,
             verbose="q",
@@ -1417,19 +1597,13 @@ def plot_data(
             y=df_data.y,
             pen=kwargs.get("map_line_pen", "2p,red"),
         )
+        # get the start and end points of the profile
+        (start_x, start_y), (end_x, end_y) = _endpoints(df_data)
+        # both labels share a style, so plot them together
         fig.text(
-            x=df_data.loc[df_data.dist.idxmin()].x,
-            y=df_data.loc[df_data.dist.idxmin()].y,
-            text=kwargs.get("start_label", "A"),
-            fill="white",
-            font="12p,Helvetica,black",
-            justify="CM",
-            clearance="+tO",
-        )
-        fig.text(
-            x=df_data.loc[df_data.dist.idxmax()].x,
-            y=df_data.loc[df_data.dist.idxmax()].y,
-            text=kwargs.get("end_label", "B"),
+            x=[start_x, end_x],
+            y=[start_y, end_y],
+            text=[kwargs.get("start_label", "A"), kwargs.get("end_label", "B")],
             fill="white",
             font="12p,Helvetica,black",
             justify="CM",
@@ -1465,6 +1639,47 @@ def plot_data(
     return fig, df_data
 
 
+def _rel_and_cum(df: pd.DataFrame) -> tuple[typing.Any, typing.Any]:
+    """
+    Get the distance of each point from the previous point, and the cumulative
+    distance, for all but the first point of a dataframe with columns x and y. Any
+    NaN distances are skipped in the cumulative sum, as with pandas' cumsum.
+    """
+    x = df.x.to_numpy(dtype=np.float64)
+    y = df.y.to_numpy(dtype=np.float64)
+    # write the distances into the x differences to avoid another temporary array
+    rel = np.diff(x)
+    np.hypot(rel, np.diff(y), out=rel)
+    cum = np.nancumsum(rel)
+    return rel, cum
+
+
+def _region_from_xy(df: pd.DataFrame) -> tuple[float, float, float, float]:
+    """
+    Get the bounding region (xmin, xmax, ymin, ymax) of the x and y columns.
+    """
+    x = df.x.to_numpy()
+    y = df.y.to_numpy()
+    return (float(x.min()), float(x.max()), float(y.min()), float(y.max()))
+
+
+def _endpoints(
+    df: pd.DataFrame,
+) -> tuple[tuple[float, float], tuple[float, float]]:
+    """
+    Get the x,y coordinates of the points with the smallest and largest distances. If
+    the distances are sorted these are just the first and last rows.
+    """
+    if df.dist.is_monotonic_increasing:
+        start, end = 0, -1
+    else:
+        dist = df.dist.to_numpy()
+        start, end = int(np.nanargmin(dist)), int(np.nanargmax(dist))
+    x = df.x.to_numpy()[[start, end]]
+    y = df.y.to_numpy()[[start, end]]
+    return (x[0], y[0]), (x[1], y[1])
+
+
 def rel_dist(
     df: pd.DataFrame,
     reverse: bool = False,
@@ -1484,19 +1699,17 @@ def rel_dist(
     pd.DataFrame
         Returns original dataframe with additional column rel_dist
     """
-    df = df.copy()
     if reverse is True:
         df1 = df[::-1].reset_index(drop=True)
     elif reverse is False:
-        df1 = df.copy()
+        df1 = df
 
-    # from https://stackoverflow.com/a/75824992/18686384
-    df1["x_lag"] = df1["x"].shift(1)
-    df1["y_lag"] = df1["y"].shift(1)
-    df1["rel_dist"] = np.sqrt(
-        (df1["x"] - df1["x_lag"]) ** 2 + (df1["y"] - df1["y_lag"]) ** 2
-    )
-    df1 = df1.drop(["x_lag", "y_lag"], axis=1)
+    # distance of each point from the previous, the first point has none so is
+    # dropped
+    rel, _ = _rel_and_cum(df1)
+
+    # assign returns a new dataframe, so the input isn't altered
+    df1 = df1.iloc[1:].assign(rel_dist=rel)
     return df1.dropna(subset=["rel_dist"])
 
     # from sklearn.metrics import pairwise_distances
@@ -1538,10 +1751,12 @@ def cum_dist(df: pd.DataFrame, **kwargs: typing.Any) -> pd.DataFrame:
         Returns original dataframe with additional column dist
     """
     reverse = kwargs.get("reverse", False)
-    df1 = df.copy()
-    df1 = rel_dist(df1, reverse=reverse)
-    df1["dist"] = df1.rel_dist.cumsum()
-    return df1
+    df1 = df[::-1].reset_index(drop=True) if reverse is True else df
+
+    # get relative and cumulative distances together and add them in one go
+    rel, cum = _rel_and_cum(df1)
+    df1 = df1.iloc[1:].assign(rel_dist=rel, dist=cum)
+    return df1.dropna(subset=["rel_dist"])
 
 
 def draw_lines(**kwargs: typing.Any) -> typing.Any:
@@ -1554,6 +1769,7 @@ def draw_lines(**kwargs: typing.Any) -> typing.Any:
     typing.Any
         Returns a list of list of vertices for each polyline in lat long.
     """
+    from polartoolkit import maps  # pylint: disable=import-outside-toplevel
 
     if ipyleaflet is None:
         msg = """
@@ -1568,11 +1784,8 @@ def draw_lines(**kwargs: typing.Any) -> typing.Any:
 
     m = maps.interactive_map(**kwargs, show=False)
 
-    def clear_m() -> None:
-        global lines  # noqa: PLW0603 # pylint:disable=global-variable-undefined
-        lines = []  # type: ignore[name-defined]
-
-    clear_m()
+    # vertices of each drawn line, filled in by the draw handler below
+    lines: list[list[typing.Any]] = []
 
     mydrawcontrol = ipyleaflet.DrawControl(
         polyline={
@@ -1588,18 +1801,12 @@ def draw_lines(**kwargs: typing.Any) -> typing.Any:
     )
 
     def handle_line_draw(self: typing.Any, action: str, geo_json: typing.Any) -> None:  # noqa: ARG001 # pylint:disable=unused-argument
-        global lines  # noqa: PLW0602 # pylint:disable=global-variable-not-assigned
-        shapes = []
-        for coords in geo_json["geometry"]["coordinates"]:
-            shapes.append(list(coords))
-        shapes = list(shapes)
         if action == "created":
-            lines.append(shapes)  # type: ignore[name-defined]
+            lines.append([list(c) for c in geo_json["geometry"]["coordinates"]])
 
     mydrawcontrol.on_draw(handle_line_draw)
     m.add_control(mydrawcontrol)
 
-    clear_m()
     display(m)
 
-    return lines  # type: ignore[name-defined]
+    return lines
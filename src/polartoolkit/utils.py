@@ -8,34 +8,25 @@
 # pylint: disable=too-many-lines
 from __future__ import annotations
 
+import contextlib
+import functools
 import logging
+import math
+import pathlib
 import random
 import typing
 
-import matplotlib as mpl
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import pygmt
-import pyogrio
 import verde as vd
 import xarray as xr
 from nptyping import NDArray
 from pyproj import Transformer
 
-# import polartoolkit.fetch as fetch
-from polartoolkit import fetch, maps
-
-# import polartoolkit.maps as maps
-
 if typing.TYPE_CHECKING:
     import geopandas as gpd
 
-try:
-    import seaborn as sns
-except ImportError:
-    sns = None
-
 
 def rmse(data: typing.Any, as_median: bool = False) -> float:
     """
@@ -61,6 +52,15 @@ def rmse(data: typing.Any, as_median: bool = False) -> float:
     return value
 
 
+@functools.lru_cache(maxsize=128)
+def _grdinfo_file(path: str, mtime: float) -> str:  # noqa: ARG001 # pylint: disable=unused-argument
+    """
+    Cached grdinfo of a grid file, the modification time is only part of the cache key
+    so edited files are re-read.
+    """
+    return typing.cast(str, pygmt.grdinfo(path, per_column="n"))
+
+
 def get_grid_info(
     grid: str | xr.DataArray,
     print_info: bool = False,
@@ -104,36 +104,47 @@ def get_grid_info(
     if isinstance(grid, xr.DataArray) and int(len(grid.dims)) > 2:
         grid = grid.squeeze()
 
+    # a single grdinfo call returns w, e, s, n, zmin, zmax, x_inc, y_inc, ...
     try:
-        spacing: float | None = float(pygmt.grdinfo(grid, per_column="n", o=7)[:-1])
+        if isinstance(grid, str) and pathlib.Path(grid).is_file():
+            # re-use the header info of files which haven't changed since last read
+            info = _grdinfo_file(grid, pathlib.Path(grid).stat().st_mtime)
+        else:
+            info = pygmt.grdinfo(grid, per_column="n")
+        fields: list[str] | None = info.split()
     except Exception as e:  # pylint: disable=broad-exception-caught
         # pygmt.exceptions.GMTInvalidInput:
+        logging.exception(e)
+        logging.warning("grid info can't be extracted")
+        fields = None
+
+    try:
+        spacing: float | None = float(fields[7])  # type: ignore[index]
+    except Exception as e:  # pylint: disable=broad-exception-caught
         logging.exception(e)
         logging.warning("grid spacing can't be extracted")
         spacing = None
 
     try:
         region: typing.Any = tuple(
-            float(pygmt.grdinfo(grid, per_column="n", o=i)[:-1]) for i in range(4)
+            float(fields[i])  # type: ignore[index]
+            for i in range(4)
         )
     except Exception as e:  # pylint: disable=broad-exception-caught
-        # pygmt.exceptions.GMTInvalidInput:
         logging.exception(e)
         logging.warning("grid region can't be extracted")
         region = None
 
     try:
-        zmin: float | None = float(pygmt.grdinfo(grid, per_column="n", o=4)[:-1])
+        zmin: float | None = float(fields[4])  # type: ignore[index]
     except Exception as e:  # pylint: disable=broad-exception-caught
-        # pygmt.exceptions.GMTInvalidInput:
         logging.exception(e)
         logging.warning("grid zmin can't be extracted")
         zmin = None
 
     try:
-        zmax = float(pygmt.grdinfo(grid, per_column="n", o=5)[:-1])
+        zmax: float | None = float(fields[5])  # type: ignore[index]
     except Exception as e:  # pylint: disable=broad-exception-caught
-        # pygmt.exceptions.GMTInvalidInput:
         logging.exception(e)
         logging.warning("grid zmax can't be extracted")
         zmax = None
@@ -287,6 +298,16 @@ def region_to_bounding_box(
     return (region[0], region[2], region[1], region[3])
 
 
+@functools.cache
+def _get_transformer(crs_from: str, crs_to: str) -> Transformer:
+    """
+    Create a pyproj Transformer between two coordinate reference systems, cached so
+    it's only created once for each pair. Coordinates are always in x, y (lon, lat)
+    order.
+    """
+    return Transformer.from_crs(crs_from, crs_to, always_xy=True)
+
+
 def latlon_to_epsg3031(
     df: pd.DataFrame | NDArray[typing.Any, typing.Any],
     reg: bool = False,
@@ -314,29 +335,19 @@ def latlon_to_epsg3031(
         Updated dataframe with new easting and northing columns or NDArray in format
         [e, w, n, s]
     """
-    transformer = Transformer.from_crs("epsg:4326", "epsg:3031")
+    transformer = _get_transformer("epsg:4326", "epsg:3031")
 
     if isinstance(df, pd.DataFrame):
-        df_new = df.copy()
-        (  # pylint: disable=unpacking-non-sequence
-            df_new[output_coord_names[0]],
-            df_new[output_coord_names[1]],
-        ) = transformer.transform(
-            df_new[input_coord_names[1]].tolist(), df_new[input_coord_names[0]].tolist()
+        x, y = transformer.transform(  # pylint: disable=unpacking-non-sequence
+            df[input_coord_names[0]].to_numpy(),
+            df[input_coord_names[1]].to_numpy(),
         )
-    else:
-        ll = df.copy()
-        df_new = list(transformer.transform(ll[0], ll[1]))
-
-    if reg is True:
-        df_new = [
-            df_new[output_coord_names[0]].min(),
-            df_new[output_coord_names[0]].max(),
-            df_new[output_coord_names[1]].min(),
-            df_new[output_coord_names[1]].max(),
-        ]
+        if reg is True:
+            return [np.nanmin(x), np.nanmax(x), np.nanmin(y), np.nanmax(y)]
+        return df.assign(**{output_coord_names[0]: x, output_coord_names[1]: y})
 
-    return df_new
+    # lists are in format [lat, lon], transform doesn't alter them so no need to copy
+    return list(transformer.transform(df[1], df[0]))
 
 
 def epsg3031_to_latlon(
@@ -367,28 +378,20 @@ def epsg3031_to_latlon(
         format [e, w, n, s], or list in format [lat, lon]
     """
 
-    transformer = Transformer.from_crs("epsg:3031", "epsg:4326")
-
-    df_out = df.copy()
+    transformer = _get_transformer("epsg:3031", "epsg:4326")
 
     if isinstance(df, pd.DataFrame):
-        (  # pylint: disable=unpacking-non-sequence
-            df_out[output_coord_names[1]],  # type: ignore[call-overload]
-            df_out[output_coord_names[0]],  # type: ignore[call-overload]
-        ) = transformer.transform(
-            df_out[input_coord_names[0]].tolist(),  # type: ignore[call-overload]
-            df_out[input_coord_names[1]].tolist(),  # type: ignore[call-overload]
+        lon, lat = transformer.transform(  # pylint: disable=unpacking-non-sequence
+            df[input_coord_names[0]].to_numpy(),
+            df[input_coord_names[1]].to_numpy(),
         )
         if reg is True:
-            df_out = [
-                df_out[output_coord_names[0]].min(),  # type: ignore[call-overload]
-                df_out[output_coord_names[0]].max(),  # type: ignore[call-overload]
-                df_out[output_coord_names[1]].min(),  # type: ignore[call-overload]
-                df_out[output_coord_names[1]].max(),  # type: ignore[call-overload]
-            ]
-    else:
-        df_out = list(transformer.transform(df_out[0], df_out[1]))
-    return df_out
+            return [np.nanmin(lon), np.nanmax(lon), np.nanmin(lat), np.nanmax(lat)]
+        return df.assign(**{output_coord_names[1]: lat, output_coord_names[0]: lon})
+
+    # return lists in format [lat, lon]
+    lon, lat = transformer.transform(df[0], df[1])  # pylint: disable=unpacking-non-sequence
+    return [lat, lon]
 
 
 def points_inside_region(
@@ -416,24 +419,16 @@ def points_inside_region(
     pd.DataFrame
        returns a subset dataframe
     """
-    # make a copy of the dataframe
-    df1 = df.copy()
-
-    # make column of booleans for whether row is within the region
-    df1["inside_tmp"] = vd.inside(
-        coordinates=(df1[names[0]], df1[names[1]]), region=region
-    )
+    # boolean mask of whether each row is within the region
+    x = df[names[0]].to_numpy()
+    y = df[names[1]].to_numpy()
+    inside = (x >= region[0]) & (x <= region[1]) & (y >= region[2]) & (y <= region[3])
 
+    # subset if False for reverse, otherwise if True
     if reverse is True:
-        # subset if False
-        df_result = df1.loc[df1.inside_tmp == False].copy()  # noqa: E712 # pylint: disable=singleton-comparison
+        inside = ~inside
 
-    else:
-        # subset if True
-        df_result = df1.loc[df1.inside_tmp == True].copy()  # noqa: E712 # pylint: disable=singleton-comparison
-
-    # drop the column 'inside'
-    return df_result.drop(columns="inside_tmp")
+    return df.loc[inside].copy()
 
 
 def block_reduce(
@@ -469,9 +464,9 @@ def block_reduce(
     if input_data_names is None:
         input_data_names = tuple(df.columns.drop(input_coord_names))
 
-    # get tuples of pd.Series
-    input_coords = tuple([df[col] for col in input_coord_names])  # pylint: disable=consider-using-generator
-    input_data = tuple([df[col] for col in input_data_names])  # pylint: disable=consider-using-generator
+    # get tuples of numpy arrays
+    input_coords = tuple(df[col].to_numpy() for col in input_coord_names)
+    input_data = tuple(df[col].to_numpy() for col in input_data_names)
 
     # apply reduction
     coordinates, data = reducer.filter(
@@ -479,17 +474,31 @@ def block_reduce(
         data=input_data,
     )
 
-    # add reduced coordinates to a dictionary
-    coord_cols = dict(zip(input_coord_names, coordinates))
-
-    # add reduced data to a dictionary
+    # a single data column is returned as an array instead of a tuple of arrays
     if len(input_data_names) < 2:
-        data_cols = {input_data_names[0]: data}
-    else:
-        data_cols = dict(zip(input_data_names, data))
+        data = (data,)
+
+    # build the dataframe column by column so each column keeps its own dtype
+    return pd.DataFrame(
+        dict(
+            zip(
+                (*input_coord_names, *input_data_names),
+                (*coordinates, *data),
+            )
+        )
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _read_shapefile(path: str, mtime: float) -> gpd.GeoDataFrame:  # noqa: ARG001 # pylint: disable=unused-argument
+    """
+    Cached read of a shapefile, the modification time is only part of the cache key so
+    edited files are re-read. Only a few files are kept since each is a full
+    GeoDataFrame.
+    """
+    import pyogrio  # pylint: disable=import-outside-toplevel
 
-    # merge dicts and create dataframe
-    return pd.DataFrame(data=coord_cols | data_cols)
+    return pyogrio.read_dataframe(path)
 
 
 def mask_from_shp(
@@ -503,6 +512,7 @@ def mask_from_shp(
     crs: str = "epsg:3031",
     pixel_register: bool = True,
     input_coord_names: tuple[str, str] = ("x", "y"),
+    reproject: bool = False,
 ) -> xr.DataArray:
     """
     Create a mask or a masked grid from area inside or outside of a closed shapefile.
@@ -532,14 +542,31 @@ def mask_from_shp(
     crs : str, optional
         if grid is provided, rasterio needs to assign a coordinate reference system via
         an epsg code, by default "epsg:3031"
+    reproject : bool, optional
+        reproject the shapes to `crs` if they have a different coordinate reference
+        system, by default False
 
     Returns
     -------
     xarray.DataArray
         Returns either a masked grid, or the mask grid itself.
     """
+    import rasterio.features  # pylint: disable=import-outside-toplevel
+
+    if isinstance(shapefile, str):
+        shp = _read_shapefile(shapefile, pathlib.Path(shapefile).stat().st_mtime)
+    else:
+        shp = shapefile
 
-    shp = pyogrio.read_dataframe(shapefile) if isinstance(shapefile, str) else shapefile
+    if shp.crs is not None and shp.crs != crs:
+        if reproject is True:
+            shp = shp.to_crs(crs)
+        else:
+            msg = (
+                f"shapefile crs ({shp.crs}) differs from the grid crs ({crs}), set "
+                "`reproject=True` to reproject the shapes before masking"
+            )
+            logging.warning(msg)
 
     if xr_grid is None and grid_file is None:
         coords = vd.grid_coordinates(
@@ -550,7 +577,7 @@ def mask_from_shp(
         ds = vd.make_xarray_grid(
             coords,
             np.ones_like(coords[0]),
-            dims=reversed(input_coord_names),
+            dims=tuple(reversed(input_coord_names)),
             data_names="z",
         )
         xds = ds.z.rio.write_crs(crs)
@@ -568,18 +595,28 @@ def mask_from_shp(
             original_dims[1], original_dims[0]
         )
 
-    masked_grd = xds.rio.clip(
-        shp.geometry,
-        xds.rio.crs,
-        drop=False,
-        invert=invert,
-    )
-    mask_grd = np.isfinite(masked_grd)
-
     if masked is True:
-        output = masked_grd
+        output = xds.rio.clip(
+            shp.geometry,
+            xds.rio.crs,
+            drop=False,
+            invert=invert,
+        )
     elif masked is False:
-        output = mask_grd
+        # only the mask is needed, so rasterize the shapes onto the grid instead of
+        # clipping the data, geometry_mask is True outside of the shapes
+        mask = rasterio.features.geometry_mask(
+            shp.geometry,
+            out_shape=xds.shape,
+            transform=xds.rio.transform(),
+            invert=not invert,
+        )
+        output = xr.DataArray(
+            mask & np.isfinite(xds.to_numpy()),
+            coords=xds.coords,
+            dims=xds.dims,
+            name=xds.name,
+        )
 
     try:
         output = output.drop_vars("spatial_ref")
@@ -717,38 +754,28 @@ def grd_trend(
     tuple[xr.DataArray, xr.DataArray]
         returns xr.DataArrays of the fitted surface, and the detrended grid.
     """
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
+    from polartoolkit import maps  # pylint: disable=import-outside-toplevel
 
-    # convert grid to a dataframe
-    df0 = vd.grid_to_table(da).astype("float64")
-    df = df0.dropna().copy()
+    # broadcast the 1D coordinates to the shape of the grid
+    x = da[coords[0]].broadcast_like(da).transpose(*da.dims).to_numpy()
+    y = da[coords[1]].broadcast_like(da).transpose(*da.dims).to_numpy()
+    values = da.to_numpy().astype("float64")
+
+    # only fit and evaluate the trend at the grid cells with data
+    mask = np.isfinite(values)
 
     # define a trend
-    trend = vd.Trend(degree=deg).fit((df[coords[0]], df[coords[1]]), df[coords[2]])
+    trend = vd.Trend(degree=deg).fit((x[mask], y[mask]), values[mask])
 
     # fit a trend to the grid of degree: deg
-    df["fit"] = trend.predict((df[coords[0]], df[coords[1]]))
+    fit_values = np.full(values.shape, np.nan)
+    fit_values[mask] = trend.predict((x[mask], y[mask]))
+    fit = da.copy(data=fit_values)
 
     # remove the trend from the data
-    df["detrend"] = df[coords[2]] - df.fit
-
-    info = get_grid_info(da)
-    spacing = info[0]
-    region = info[1]
-    registration = info[4]
-
-    fit = pygmt.xyz2grd(
-        data=df[[coords[0], coords[1], "fit"]],
-        region=region,
-        spacing=spacing,
-        registration=registration,
-    )
-
-    detrend = pygmt.xyz2grd(
-        data=df[[coords[0], coords[1], "detrend"]],
-        region=region,
-        spacing=spacing,
-        registration=registration,
-    )
+    detrend = da.copy(data=values - fit_values)
 
     if plot is True:
         if plot_type == "xarray":
@@ -837,6 +864,36 @@ def grd_trend(
     return fit, detrend
 
 
+def _cut_to_region(
+    grid: xr.DataArray,
+    region: tuple[float, float, float, float],
+) -> xr.DataArray:
+    """
+    Subset a grid to the nodes within a region without resampling.
+
+    Parameters
+    ----------
+    grid : xr.DataArray
+        input grid with dimensions ordered (..., y, x)
+    region : tuple[float, float, float, float]
+        bounding region in GMT format
+
+    Returns
+    -------
+    xr.DataArray
+        the grid nodes within the region
+    """
+    y_dim, x_dim = grid.dims[-2:]
+    x = grid[x_dim].to_numpy()
+    y = grid[y_dim].to_numpy()
+    return grid.isel(
+        {
+            x_dim: (x >= region[0]) & (x <= region[1]),
+            y_dim: (y >= region[2]) & (y <= region[3]),
+        }
+    )
+
+
 def grd_compare(
     da1: xr.DataArray | str,
     da2: xr.DataArray | str,
@@ -879,6 +936,11 @@ def grd_compare(
     tuple[xr.DataArray, xr.DataArray, xr.DataArray]
         three xr.DataArrays: (diff, resampled grid1, resampled grid2)
     """
+    import matplotlib as mpl  # pylint: disable=import-outside-toplevel
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
+    from polartoolkit import fetch, maps  # pylint: disable=import-outside-toplevel
+
     shp_mask = kwargs.get("shp_mask", None)
     region: tuple[float, float, float, float] = kwargs.get("region", None)
     verbose = kwargs.get("verbose", "e")
@@ -942,25 +1004,49 @@ def grd_compare(
             region = da1_reg
         # use registration from first grid, or from kwarg
         if kwargs.get("registration", None) is None:
-            registration = get_grid_info(da1)[4]
+            registration = da1_info[4]
         else:
             registration = kwargs.get("registration", None)
-        # resample grids
-        grid1 = fetch.resample_grid(
-            da1,
-            spacing=spacing,
-            region=region,
-            registration=registration,
-            verbose=verbose,
-        )
+        # if the grid nodes already coincide, only cut the grids to the inner region
+        x_offset = (da1_reg[0] - da2_reg[0]) / spacing
+        y_offset = (da1_reg[2] - da2_reg[2]) / spacing
+        grid1, grid2 = None, None
+        if (
+            (da1_spacing == da2_spacing)
+            and (da1_info[4] == da2_info[4] == registration)
+            and np.isclose(x_offset, round(x_offset))
+            and np.isclose(y_offset, round(y_offset))
+        ):
+            grid1 = _cut_to_region(da1, region)
+            grid2 = _cut_to_region(da2, region)
+            dims = grid1.dims[-2:]
+            if (
+                grid1.shape == grid2.shape
+                and grid2.dims[-2:] == dims
+                and all(np.allclose(grid1[dim], grid2[dim]) for dim in dims)
+            ):
+                # use identical coordinates so the difference aligns all the nodes
+                grid2 = grid2.assign_coords({dim: grid1[dim] for dim in dims})
+            else:
+                # e.g. flipped or half-cell offset nodes, so resample instead
+                grid1, grid2 = None, None
+        if grid1 is None or grid2 is None:
+            # resample grids
+            grid1 = fetch.resample_grid(
+                da1,
+                spacing=spacing,
+                region=region,
+                registration=registration,
+                verbose=verbose,
+            )
 
-        grid2 = fetch.resample_grid(
-            da2,
-            spacing=spacing,
-            region=region,
-            registration=registration,
-            verbose=verbose,
-        )
+            grid2 = fetch.resample_grid(
+                da2,
+                spacing=spacing,
+                region=region,
+                registration=registration,
+                verbose=verbose,
+            )
 
     grid1 = typing.cast(xr.DataArray, grid1)
     grid2 = typing.cast(xr.DataArray, grid2)
@@ -1196,7 +1282,7 @@ def make_grid(
         Returns a xr.DataArray with 1 variable of constant value.
     """
     coords = vd.grid_coordinates(region=region, spacing=spacing, pixel_register=True)
-    data = np.ones_like(coords[0]) * value
+    data = np.full(coords[0].shape, value, dtype=np.float64)
     return typing.cast(
         xr.DataArray,
         vd.make_xarray_grid(coords, data, dims=["y", "x"], data_names=name),
@@ -1235,10 +1321,14 @@ def raps(
     spacing : float
         grid spacing if input is not a grid
     """
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
     # Check if seaborn is installed
-    if sns is None:
+    try:
+        import seaborn as sns  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
         msg = "Missing optional dependency 'seaborn' required for plotting."
-        raise ImportError(msg)
+        raise ImportError(msg) from e
 
     region = kwargs.get("region", None)
     spacing = kwargs.get("spacing", None)
@@ -1256,59 +1346,76 @@ def raps(
         )
     elif plot_type == "mpl":
         plt.figure()
-    for i, j in enumerate(names):
-        if isinstance(data, pd.DataFrame):
-            df = data
-            grid = pygmt.xyz2grd(
-                df[["x", "y", j]],
-                registration="p",
-                region=region,
-                spacing=spacing,
+    # prepare the grids of each name, a single grid is only filled once
+    grids: list[str | xr.DataArray]
+    if isinstance(data, pd.DataFrame):
+        grids = [
+            pygmt.grdfill(
+                pygmt.xyz2grd(
+                    data[["x", "y", j]],
+                    registration="p",
+                    region=region,
+                    spacing=spacing,
+                ),
+                mode="n",
             )
-            pygmt.grdfill(grid, mode="n", outgrid="tmp_outputs/fft.nc")
-            grid = "tmp_outputs/fft.nc"
-        elif isinstance(data, str):
-            grid = data
-        elif isinstance(data, list):
-            data[i].to_netcdf("tmp_outputs/fft.nc")
-            pygmt.grdfill("tmp_outputs/fft.nc", mode="n", outgrid="tmp_outputs/fft.nc")
-            grid = "tmp_outputs/fft.nc"
-        elif isinstance(data, xr.Dataset):
-            data[j].to_netcdf("tmp_outputs/fft.nc")
-            pygmt.grdfill("tmp_outputs/fft.nc", mode="n", outgrid="tmp_outputs/fft.nc")
-            grid = "tmp_outputs/fft.nc"
-        elif isinstance(data, xr.DataArray):
-            data.to_netcdf("tmp_outputs/fft.nc")
-            pygmt.grdfill("tmp_outputs/fft.nc", mode="n", outgrid="tmp_outputs/fft.nc")
-            grid = "tmp_outputs/fft.nc"
-        if filter_str is not None:
-            with pygmt.clib.Session() as session:
-                fin = grid
-                fout = "tmp_outputs/fft.nc"
-                args = f"{fin} -F{filter_str} -D0 -G{fout}"
-                session.call_module("grdfilter", args)
-            grid = "tmp_outputs/fft.nc"
-        with pygmt.clib.Session() as session:
-            fin = grid
-            fout = "tmp_outputs/raps.txt"
-            args = f"{fin} -Er+wk -Na+d -G{fout}"
-            session.call_module("grdfft", args)
-        if plot_type == "mpl":
-            raps_df = pd.read_csv(
-                "tmp_outputs/raps.txt",
-                header=None,
-                delimiter="\t",
-                names=("wavelength", "power", "stdev"),
+            for j in names
+        ]
+    elif isinstance(data, str):
+        grids = [data] * len(names)
+    elif isinstance(data, list):
+        grids = [pygmt.grdfill(data[i], mode="n") for i in range(len(names))]
+    elif isinstance(data, xr.Dataset):
+        grids = [pygmt.grdfill(data[j], mode="n") for j in names]
+    elif isinstance(data, xr.DataArray):
+        grids = [pygmt.grdfill(data, mode="n")] * len(names)
+    if filter_str is not None:
+        # filter each distinct grid once, repeated grids share the filtered result
+        unique = {id(g): g for g in grids}
+        filtered = {
+            key: pygmt.grdfilter(g, filter=filter_str, distance="0")
+            for key, g in unique.items()
+        }
+        grids = [filtered[id(g)] for g in grids]
+
+    # compute the spectrum of each unique grid in a single GMT session
+    spectra: dict[int, pd.DataFrame] = {}
+    with pygmt.clib.Session() as session:
+        for grid in grids:
+            if id(grid) in spectra:
+                continue
+            # pass loaded grids to GMT in memory, filenames can be read directly
+            file_context: typing.Any = (
+                contextlib.nullcontext(grid)
+                if isinstance(grid, str)
+                else session.virtualfile_from_grid(grid)
             )
+            with file_context as fin, pygmt.helpers.GMTTempFile() as tmpfile:
+                args = f"{fin} -Er+wk -Na+d -G{tmpfile.name}"
+                session.call_module("grdfft", args)
+                spectra[id(grid)] = pd.read_csv(
+                    tmpfile.name,
+                    header=None,
+                    delimiter="\t",
+                    names=("wavelength", "power", "stdev"),
+                    dtype=np.float64,
+                    engine="c",
+                    memory_map=True,
+                )
+
+    for j, grid in zip(names, grids):
+        raps_df = spectra[id(grid)]
+        if plot_type == "mpl":
             ax = sns.lineplot(x=raps_df.wavelength, y=raps_df.power, label=j)
             ax = sns.scatterplot(x=raps_df.wavelength, y=raps_df.power)
             ax.set_xlabel("Wavelength (km)")
             ax.set_ylabel("Radially Averaged Power ($mGal^{2}km$)")
         elif plot_type == "pygmt":
             color = f"{random.randrange(255)}/{random.randrange(255)}/{random.randrange(255)}"  # noqa: E501
-            spec.plot("tmp_outputs/raps.txt", pen=f"1p,{color}")
+            spec.plot(x=raps_df.wavelength, y=raps_df.power, pen=f"1p,{color}")
             spec.plot(
-                "tmp_outputs/raps.txt",
+                x=raps_df.wavelength,
+                y=raps_df.power,
                 color=color,
                 style="T5p",
                 # error_bar='y+p0.5p',
@@ -1350,20 +1457,14 @@ def coherency(
     spacing : float
         grid spacing if input is pd.DataFrame
     """
-
-    # Check if seaborn is installed
-    if sns is None:
-        msg = "Missing optional dependency 'seaborn' required for plotting."
-        raise ImportError(msg)
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
 
     region = kwargs.get("region", None)
     spacing = kwargs.get("spacing", None)
 
-    plt.figure()
-
     if isinstance(grids[0], (str, xr.DataArray)):
-        pygmt.grdfill(grids[0], mode="n", outgrid="tmp_outputs/fft_1.nc")
-        pygmt.grdfill(grids[1], mode="n", outgrid="tmp_outputs/fft_2.nc")
+        grid1 = pygmt.grdfill(grids[0], mode="n")
+        grid2 = pygmt.grdfill(grids[1], mode="n")
     elif isinstance(grids[0], pd.DataFrame):  # type: ignore[unreachable]
         grid1 = pygmt.xyz2grd(
             grids[0],
@@ -1377,42 +1478,57 @@ def coherency(
             region=region,
             spacing=spacing,
         )
-        pygmt.grdfill(grid1, mode="n", outgrid="tmp_outputs/fft_1.nc")
-        pygmt.grdfill(grid2, mode="n", outgrid="tmp_outputs/fft_2.nc")
+        grid1 = pygmt.grdfill(grid1, mode="n")
+        grid2 = pygmt.grdfill(grid2, mode="n")
+
+    names = (
+        "Wavelength (km)",
+        "Xpower",
+        "stdev_xp",
+        "Ypower",
+        "stdev_yp",
+        "coherent power",
+        "stdev_cp",
+        "noise power",
+        "stdev_np",
+        "phase",
+        "stdev_p",
+        "admittance",
+        "stdev_a",
+        "gain",
+        "stdev_g",
+        "coherency",
+        "stdev_c",
+    )
+    with pygmt.clib.Session() as session:  # noqa: SIM117
+        with pygmt.helpers.GMTTempFile() as tmpfile:
+            # pass the filled grids to GMT in memory
+            file_context1 = session.virtualfile_from_grid(grid1)
+            file_context2 = session.virtualfile_from_grid(grid2)
+            with file_context1 as fin1, file_context2 as fin2:
+                args = f"{fin1} {fin2} -E+wk+n -Na+d -G{tmpfile.name}"
+                session.call_module("grdfft", args)
+            df = pd.read_csv(
+                tmpfile.name,
+                header=None,
+                delimiter="\t",
+                names=names,
+                dtype=np.float64,
+                engine="c",
+                memory_map=True,
+            )
 
-    with pygmt.clib.Session() as session:
-        fin1 = "tmp_outputs/fft_1.nc"
-        fin2 = "tmp_outputs/fft_2.nc"
-        fout = "tmp_outputs/coherency.txt"
-        args = f"{fin1} {fin2} -E+wk+n -Na+d -G{fout}"
-        session.call_module("grdfft", args)
-
-    df = pd.read_csv(
-        "tmp_outputs/coherency.txt",
-        header=None,
-        delimiter="\t",
-        names=(
-            "Wavelength (km)",
-            "Xpower",
-            "stdev_xp",
-            "Ypower",
-            "stdev_yp",
-            "coherent power",
-            "stdev_cp",
-            "noise power",
-            "stdev_np",
-            "phase",
-            "stdev_p",
-            "admittance",
-            "stdev_a",
-            "gain",
-            "stdev_g",
-            "coherency",
-            "stdev_c",
-        ),
+    _, ax = plt.subplots()
+    ax.plot(
+        df["Wavelength (km)"].to_numpy(),
+        df.coherency.to_numpy(),
+        marker="o",
+        label=label,
     )
-    ax = sns.lineplot(df["Wavelength (km)"], df.coherency, label=label)  # pylint: disable=too-many-function-args
-    ax = sns.scatterplot(x=df["Wavelength (km)"], y=df.coherency)
+    # seaborn added the legend and the axis labels automatically
+    ax.legend()
+    ax.set_xlabel("Wavelength (km)")
+    ax.set_ylabel("coherency")
 
     ax.invert_xaxis()
     ax.set_yscale("log")
@@ -1422,6 +1538,21 @@ def coherency(
     return ax
 
 
+# precomputed (rows, columns) of the small subplot layouts
+_SQUARE_SUBPLOTS = {
+    1: (1, 1),
+    2: (1, 2),
+    3: (2, 2),
+    4: (2, 2),
+    5: (2, 3),
+    6: (2, 3),
+    7: (3, 3),
+    8: (3, 3),
+    9: (3, 3),
+}
+
+
+@functools.cache
 def square_subplots(n: int) -> tuple[int, int]:
     """
     From https://github.com/matplotlib/grid-strategy/blob/master/src/grid_strategy/strategies.py
@@ -1440,25 +1571,16 @@ def square_subplots(n: int) -> tuple[int, int]:
         example a 3 x 2 grid would be represented as ``(3, 3)``, because there are 2
         rows of length 3.
     """
-    special_cases = {
-        1: (1, 1),
-        2: (1, 2),
-        3: (2, 2),
-        4: (2, 2),
-        5: (2, 3),
-        6: (2, 3),
-        7: (3, 3),
-        8: (3, 3),
-        9: (3, 3),
-    }
-    if n in special_cases:
-        return special_cases[n]
-
-    # May not work for very large n
-    n_sqrtf = np.sqrt(n)
-    n_sqrt = int(np.ceil(n_sqrtf))
-
-    if n_sqrtf == n_sqrt:
+    if n in _SQUARE_SUBPLOTS:
+        return _SQUARE_SUBPLOTS[n]
+
+    # ceiling of the square root, exact for any size of n
+    n_sqrt = math.isqrt(n)
+    is_square = n_sqrt * n_sqrt == n
+    if not is_square:
+        n_sqrt += 1
+
+    if is_square:
         # Perfect square, we're done
         x, y = n_sqrt, n_sqrt
     elif n <= n_sqrt * (n_sqrt - 1):
@@ -1488,19 +1610,27 @@ def square_subplots(n: int) -> tuple[int, int]:
     return x, y
 
 
-def random_color() -> str:
+def random_color(rng: np.random.Generator | None = None) -> str:
     """
     generate a random color in format R/G/B
 
+    Parameters
+    ----------
+    rng : np.random.Generator, optional
+        random number generator to draw the color from, by default uses numpy's global
+        random state, so colors are reproducible with ``np.random.seed``
+
     Returns
     -------
     str
         returns a random color string
     """
-    return (
-        f"{int(np.random.random() * 256)}/{int(np.random.random() * 256)}"
-        f"/{int(np.random.random() * 256)}"
-    )
+    if rng is None:
+        # draw all 3 components from the global random state in one call
+        r, g, b = (np.random.random(3) * 256).astype(int)
+    else:
+        r, g, b = rng.integers(0, 256, size=3)
+    return f"{r}/{g}/{b}"
 
 
 def get_min_max(
@@ -1527,18 +1657,31 @@ def get_min_max(
         returns the min and max values.
     """
 
-    if shapefile is None:
-        if robust:
-            v_min, v_max = np.nanquantile(grid, [0.02, 0.98])
+    # for dask-backed grids, get the min and max in a single pass over the chunks
+    # instead of loading the whole grid into memory. Masking by a shapefile needs
+    # the loaded grid anyway, so that case uses the numpy path below.
+    if shapefile is None and not robust:
+        try:
+            import dask.array  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            dask_backed = False
         else:
-            v_min, v_max = np.nanmin(grid), np.nanmax(grid)
+            dask_backed = isinstance(getattr(grid, "data", None), dask.array.Array)
+        if dask_backed:
+            v_min, v_max = dask.compute(grid.min(skipna=True), grid.max(skipna=True))
+            return (float(v_min), float(v_max))
 
-    elif shapefile is not None:
-        masked = mask_from_shp(shapefile, xr_grid=grid, masked=True, invert=False)
-        if robust:
-            v_min, v_max = np.nanquantile(masked, [0.02, 0.98])
-        else:
-            v_min, v_max = np.nanmin(masked), np.nanmax(masked)
+    values = grid.to_numpy()
+
+    if shapefile is not None:
+        # only use the values inside the shapes, without creating a masked grid
+        mask = mask_from_shp(shapefile, xr_grid=grid, masked=False, invert=False)
+        values = values[mask.to_numpy()]
+
+    if robust:
+        v_min, v_max = np.nanquantile(values, [0.02, 0.98])
+    else:
+        v_min, v_max = np.nanmin(values), np.nanmax(values)
 
     return (v_min, v_max)
 
@@ -1559,16 +1702,40 @@ def shapes_to_df(shapes: list[float]) -> pd.DataFrame:
         Dataframe with x, y, and shape_num.
     """
 
-    df = pd.DataFrame()
-    for i, j in enumerate(shapes):
-        lon = [coord[0] for coord in j]  # type: ignore[attr-defined]
-        lat = [coord[1] for coord in j]  # type: ignore[attr-defined]
-        shape = pd.DataFrame({"lon": lon, "lat": lat, "shape_num": i})
-        df = pd.concat((df, shape))
+    # stack the vertices of all the shapes into a single array
+    arrs = [np.asarray(j, dtype=np.float64) for j in shapes]
+    lens = np.fromiter((len(a) for a in arrs), dtype=np.int64, count=len(arrs))
+    coords = np.concatenate(arrs, axis=0)
+
+    # number each shape, and each vertex within its shape
+    shape_num = np.repeat(np.arange(len(arrs)), lens)
+    vertex_num = np.arange(len(coords)) - np.repeat(np.cumsum(lens) - lens, lens)
+
+    df = pd.DataFrame(
+        {"lon": coords[:, 0], "lat": coords[:, 1], "shape_num": shape_num},
+        index=vertex_num,
+    )
 
     return latlon_to_epsg3031(df)
 
 
+def _first_shape_xy(
+    shapes: list[float],
+) -> tuple[NDArray[typing.Any, typing.Any], NDArray[typing.Any, typing.Any]]:
+    """
+    Get the EPSG:3031 x and y coordinates of the first shape drawn with
+    `regions.draw_region` or `profile.draw_lines`, without building a dataframe of all
+    the shapes.
+    """
+    if len(shapes) > 1:
+        logging.info(
+            "supplied dataframe has multiple polygons, only using the first one."
+        )
+    lon, lat = np.asarray(shapes[0], dtype=np.float64).T[:2]
+    x, y = _get_transformer("epsg:4326", "epsg:3031").transform(lon, lat)  # pylint: disable=unpacking-non-sequence
+    return x, y
+
+
 def polygon_to_region(polygon: list[float]) -> tuple[float, float, float, float]:
     """
     convert the output of `regions.draw_region` to bounding region in EPSG:3031
@@ -1584,15 +1751,7 @@ def polygon_to_region(polygon: list[float]) -> tuple[float, float, float, float]
         region in format [e,w,n,s]
     """
 
-    df = shapes_to_df(polygon)
-
-    if df.shape_num.max() > 0:
-        logging.info(
-            "supplied dataframe has multiple polygons, only using the first one."
-        )
-        df = df[df.shape_num == 0]
-
-    reg: tuple[float, float, float, float] = vd.get_region((df.x, df.y))
+    reg: tuple[float, float, float, float] = vd.get_region(_first_shape_xy(polygon))
 
     return reg
 
@@ -1604,6 +1763,7 @@ def mask_from_polygon(
     grid: str | xr.DataArray | None = None,
     region: tuple[float, float, float, float] | None = None,
     spacing: int | None = None,
+    return_mask_only: bool = False,
     **kwargs: typing.Any,
 ) -> xr.DataArray:
     """
@@ -1623,83 +1783,106 @@ def mask_from_polygon(
         region to create a grid if none is supplied, by default None
     spacing : int, optional
         spacing to create a grid if none is supplied, by default None
+    return_mask_only : bool, optional
+        return a boolean grid which is True for the unmasked nodes, instead of the
+        masked grid values, by default False
 
     Returns
     -------
     xr.DataArray
         masked grid or mask grid with 1's inside the mask.
     """
+    from matplotlib.path import Path  # pylint: disable=import-outside-toplevel
 
-    # convert drawn polygon into dataframe
-    df = shapes_to_df(polygon)
-    data_coords = (df.x, df.y)
+    # get coordinates of the drawn polygon
+    data_coords = _first_shape_xy(polygon)
 
-    # remove additional polygons
-    if df.shape_num.max() > 0:
-        logging.info(
-            "supplied dataframe has multiple polygons, only using the first one."
-        )
-        df = df[df.shape_num == 0]
-
-    # if grid given as filename, load it
-    if isinstance(grid, str):
-        grid = xr.load_dataarray(grid)
-        grid = typing.cast(xr.DataArray, grid)
-        ds = grid.to_dataset()
-    elif isinstance(grid, xr.DataArray):
-        ds = grid.to_dataset()
-
-    # if no grid given, make a dummy one with supplied region and spacing
-    if grid is None:
-        coords = vd.grid_coordinates(
-            region=region,
-            spacing=spacing,
-            pixel_register=kwargs.get("pixel_register", False),
-        )
-        ds = vd.make_xarray_grid(
-            coords, np.ones_like(coords[0]), dims=("y", "x"), data_names="z"
-        )
+    # open grid files lazily, only the coordinates are read until the mask is applied
+    file_context: typing.Any = (
+        xr.open_dataarray(grid)
+        if isinstance(grid, str)
+        else contextlib.nullcontext(grid)
+    )
+    with file_context as grid:
+        # if no grid given, make a dummy one with supplied region and spacing
+        if grid is None:
+            coords = vd.grid_coordinates(
+                region=region,
+                spacing=spacing,
+                pixel_register=kwargs.get("pixel_register", False),
+            )
+            z = vd.make_xarray_grid(
+                coords, np.ones_like(coords[0]), dims=("y", "x"), data_names="z"
+            ).z
+        else:
+            # name the grid 'z' regardless of the name it was supplied with
+            z = grid.rename("z")
+
+        # find the grid nodes inside the polygon
+        y_dim, x_dim = z.dims[-2:]
+        xs, ys = np.meshgrid(z[x_dim].to_numpy(), z[y_dim].to_numpy(), indexing="xy")
+        points = np.column_stack([xs.ravel(), ys.ravel()])
+        path = Path(np.column_stack(data_coords))
+        # keep nodes on the polygon boundary, the sign of the radius which expands the
+        # path depends on the direction of its vertices, so test with both
+        radius = 1e-9 * np.abs(path.vertices).max()
+        inside = (
+            path.contains_points(points, radius=radius)
+            | path.contains_points(points, radius=-radius)
+        ).reshape(xs.shape)
+
+        if return_mask_only is True:
+            return xr.DataArray(
+                ~inside if invert is True else inside,
+                coords={y_dim: z[y_dim], x_dim: z[x_dim]},
+                dims=(y_dim, x_dim),
+            )
 
-    masked = vd.convexhull_mask(
-        data_coords,
-        grid=ds,
-    ).z
+        masked = z.where(xr.DataArray(inside, dims=(y_dim, x_dim)))
 
-    # reverse the mask
-    if invert is True:
-        inverse = masked.isnull()
-        inverse = inverse.where(inverse != 0)
-        masked = inverse * ds.z
+        # reverse the mask
+        if invert is True:
+            masked = z.where(masked.isnull())
 
-    # drop nans
-    if drop_nans is True:
-        masked = masked.where(masked.notnull() == 1, drop=True)
+        # drop nans
+        if drop_nans is True:
+            masked = masked.where(masked.notnull() == 1, drop=True)
+
+        # read the masked values before the grid file is closed
+        masked = masked.load()
 
     return typing.cast(xr.DataArray, masked)
 
 
-def change_reg(grid: xr.DataArray) -> xr.DataArray:
+def change_reg(grid: str | xr.DataArray) -> xr.DataArray:
     """
-    Use GMT grdedit to change the registration type in the metadata.
+    Change the registration type in the metadata, as with GMT grdedit -T.
 
     Parameters
     ----------
-    grid : xr.DataArray
-        input grid to change the reg for.
+    grid : str or xr.DataArray
+        input grid, or grid filename, to change the reg for.
 
     Returns
     -------
     xr.DataArray
         returns a xr.DataArray with switch reg type.
     """
+    # grdedit -T keeps the node coordinates and only changes the region by half a
+    # cell, so for a loaded grid just toggle the registration of a copy of it
+    if isinstance(grid, xr.DataArray):
+        reg = grid.gmt.registration
+        f_out: xr.DataArray = grid.copy()
+        f_out.gmt.registration = 1 if reg == 0 else 0
+        return f_out
+
+    # for grid files use GMT grdedit
     with pygmt.clib.Session() as ses:  # noqa: SIM117
-        # store the input grid in a virtual file so GMT can read it from a dataarray
-        with ses.virtualfile_from_grid(grid) as f_in:
-            # send the output to a file so that we can read it
-            with pygmt.helpers.GMTTempFile(suffix=".nc") as tmpfile:
-                args = f"{f_in} -T -G{tmpfile.name}"
-                ses.call_module("grdedit", args)
-                f_out: xr.DataArray = pygmt.load_dataarray(tmpfile.name)
+        # send the output to a file so that we can read it
+        with pygmt.helpers.GMTTempFile(suffix=".nc") as tmpfile:
+            args = f"{grid} -T -G{tmpfile.name}"
+            ses.call_module("grdedit", args)
+            f_out = pygmt.load_dataarray(tmpfile.name)
     return f_out
 
 
@@ -1730,13 +1913,11 @@ def grd_blend(
             file_context1 = session.virtualfile_from_grid(grid1)
             file_context2 = session.virtualfile_from_grid(grid2)
             with file_context1 as infile1, file_context2 as infile2:
-                # if (outgrid := kwargs.get("G")) is None:
-                #     kwargs["G"] = outgrid = tmpfile.name # output to tmpfile
                 args = f"{infile1} {infile2} -Cf -G{tmpfile.name}"
                 session.call_module(module="grdblend", args=args)
-    return typing.cast(
-        xr.DataArray, pygmt.load_dataarray(infile1)
-    )  # if outgrid == tmpfile.name else None
+            # read the blended grid before the temporary file is removed
+            f_out: xr.DataArray = pygmt.load_dataarray(tmpfile.name)
+    return f_out
 
 
 def get_fig_width() -> float:
@@ -1786,7 +1967,9 @@ def gmt_str_to_list(region: tuple[float, float, float, float]) -> str:
     str
         a GMT style region string
     """
-    return "".join([str(x) + "/" for x in region])[:-1]
+    if len(region) == 4:
+        return f"{region[0]}/{region[1]}/{region[2]}/{region[3]}"
+    return "/".join(map(str, region))
 
 
 def grd_mask(
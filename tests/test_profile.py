@@ -8,3 +8,312 @@
 """
 Tests for profile module.
 """
+# %%
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pygmt
+import pytest
+import verde as vd
+import xarray as xr
+
+from polartoolkit import profile
+
+
+def dummy_grid() -> xr.DataArray:
+    (x, y) = vd.grid_coordinates(
+        region=(0, 10000, 0, 10000),
+        spacing=100,
+    )
+
+    # create a smooth field with curvature everywhere
+    z = np.sin(x / 1000) * np.cos(y / 1500) + (x * y) / 1e8
+
+    return vd.make_xarray_grid(
+        (x, y),
+        z,
+        data_names="z",
+        dims=("y", "x"),
+    ).z
+
+
+@pytest.mark.parametrize("interpolation", ["c", "b", "l"])
+@pytest.mark.parametrize(
+    ("x", "y"),
+    [
+        # near the lower edges
+        ([30.0, 150.0], [70.0, 20.0]),
+        # in the interior
+        ([4950.0, 5025.0], [5010.0, 4960.0]),
+        # near the upper edges
+        ([9850.0, 9970.0], [9930.0, 9990.0]),
+    ],
+)
+def test_sample_grid_cropped(x, y, interpolation):
+    """
+    test that cropping the grid around the points before sampling gives the same
+    values as sampling the full grid, both near the grid edges and in the interior
+    """
+    grid = dummy_grid()
+    points = pd.DataFrame({"x": x, "y": y})
+
+    cropped = profile._sample_grid(points, grid, "sampled", interpolation=interpolation)
+    full = pygmt.grdtrack(
+        points=points,
+        grid=grid,
+        newcolname="sampled",
+        no_skip=True,
+        interpolation=interpolation,
+    ).sampled.to_numpy()
+
+    # the grid was cropped
+    assert profile._crop_to_points(grid, points.x, points.y).size < grid.size
+    np.testing.assert_allclose(cropped, full)
+
+
+def test_fill_nans():
+    """
+    test the fill_nans function fills NaN's with values of the layer above
+    """
+    df = pd.DataFrame(
+        {
+            "x": [0.0, 1.0, 2.0],
+            "y": [0.0, 0.0, 0.0],
+            "dist": [0.0, 1.0, 2.0],
+            "surface": [3.0, 2.0, 1.0],
+            "icebase": [np.nan, 1.0, np.nan],
+            "bed": [0.0, np.nan, np.nan],
+        }
+    )
+
+    df_filled = profile.fill_nans(df.copy())
+
+    # same as filling each column from the previous one with pandas
+    expected = df.copy()
+    for above, below in zip(["surface", "icebase"], ["icebase", "bed"]):
+        expected[below] = expected[below].fillna(expected[above])
+
+    pd.testing.assert_frame_equal(df_filled, expected)
+    assert df_filled.bed.tolist() == [0.0, 1.0, 1.0]
+
+
+def test_sample_grids_many():
+    """
+    test the sample_grids_many function gives the same results as sampling each grid
+    with sample_grids
+    """
+    grid = dummy_grid()
+    grids = {"z1": grid, "z2": grid * 2}
+
+    df = profile.create_profile("points", start=(1000, 2000), stop=(9000, 8000), num=50)
+    # use a non-default index to check it is kept
+    df.index = df.index + 10
+
+    df_many = profile.sample_grids_many(df, grids)
+
+    expected = df
+    for name, g in grids.items():
+        expected = profile.sample_grids(expected, g, name)
+
+    pd.testing.assert_frame_equal(df_many, expected)
+    np.testing.assert_allclose(df_many.z2, df_many.z1 * 2)
+
+
+def test_sample_grids_verify():
+    """
+    test the sample_grids function only adds the sampled column, and that the check
+    of this runs when verify is True
+    """
+    grid = dummy_grid()
+    df = profile.create_profile("points", start=(1000, 2000), stop=(9000, 8000), num=50)
+    df_copy = df.copy()
+
+    df_sampled = profile.sample_grids(df, grid, "z", verify=True)
+
+    # input isn't altered
+    pd.testing.assert_frame_equal(df, df_copy)
+    pd.testing.assert_frame_equal(df_sampled.drop(columns="z"), df)
+    # resampling an existing column replaces it
+    pd.testing.assert_frame_equal(
+        profile.sample_grids(df_sampled, grid, "z", verify=True), df_sampled
+    )
+
+
+def test_create_profile_polyline_resampled():
+    """
+    test the create_profile function resamples a polyline with a cubic spline, the
+    same as with pandas' cubic interpolation
+    """
+    polyline = pd.DataFrame(
+        {
+            "x": [0.0, 1000.0, 2500.0, 3000.0, 4500.0, 6000.0],
+            "y": [0.0, 800.0, 1200.0, 2500.0, 3000.0, 2800.0],
+        }
+    )
+
+    df = profile.create_profile("polyline", polyline=polyline, num=20)
+
+    # resample with pandas instead
+    coords = profile.cum_dist(polyline).set_index("dist")
+    dist_resampled = np.linspace(coords.index.min(), coords.index.max(), 20)
+    expected = (
+        coords.reindex(coords.index.union(dist_resampled))
+        .interpolate("cubic")
+        .loc[dist_resampled]
+        .reset_index()
+    )
+
+    assert len(df) == 20
+    np.testing.assert_allclose(df.dist, dist_resampled)
+    np.testing.assert_allclose(df.x, expected.x)
+    np.testing.assert_allclose(df.y, expected.y)
+
+
+def test_cum_dist():
+    """
+    test the cum_dist function
+    """
+    df = pd.DataFrame({"x": [0.0, 3.0, 3.0, 0.0], "y": [0.0, 4.0, 8.0, 8.0]})
+    df_copy = df.copy()
+
+    df_dist = profile.cum_dist(df)
+
+    # first point has no previous point so is dropped
+    assert df_dist.index.tolist() == [1, 2, 3]
+    assert df_dist.rel_dist.tolist() == [5.0, 4.0, 3.0]
+    assert df_dist.dist.tolist() == [5.0, 9.0, 12.0]
+    # input isn't altered
+    pd.testing.assert_frame_equal(df, df_copy)
+
+    df_dist = profile.cum_dist(df, reverse=True)
+
+    assert df_dist.x.tolist() == [3.0, 3.0, 0.0]
+    assert df_dist.dist.tolist() == [3.0, 7.0, 12.0]
+
+
+def test_shorten():
+    """
+    test the shorten function gives the same result for sorted and unsorted distances
+    """
+    df = pd.DataFrame(
+        {
+            "x": [0.0, 10.0, 20.0, 30.0, 40.0],
+            "y": [0.0, 0.0, 0.0, 0.0, 0.0],
+            "dist": [0.0, 10.0, 20.0, 30.0, 40.0],
+        }
+    )
+
+    df_short = profile.shorten(df, max_dist=35, min_dist=5)
+
+    assert df_short.index.tolist() == [1, 2, 3]
+    # distances are recalculated from the new first point
+    assert df_short.dist.tolist() == [0.0, 10.0, 20.0]
+
+    # rows at exactly the max and min distances are removed
+    df_short = profile.shorten(df, max_dist=30, min_dist=10)
+    assert df_short.index.tolist() == [2]
+
+    # unsorted distances are masked rather than sliced
+    df_unsorted = df.iloc[[0, 2, 1, 4, 3]]
+    df_short = profile.shorten(df_unsorted, max_dist=35, min_dist=5)
+    assert df_short.index.tolist() == [2, 1, 3]
+    assert df_short.dist.tolist() == [0.0, 10.0, 10.0]
+
+
+def test_make_data_dict():
+    """
+    test the make_data_dict function
+    """
+    grid = dummy_grid()
+
+    data_dict = profile.make_data_dict(
+        names=["a", "b"],
+        grids=[grid, grid * 2],
+        colors=["red", "blue"],
+    )
+
+    assert list(data_dict) == ["0", "1"]
+    assert data_dict["1"]["name"] == "b"
+    assert data_dict["1"]["color"] == "blue"
+    xr.testing.assert_equal(data_dict["1"]["grid"], grid * 2)
+    # axes default to 0
+    assert [v["axis"] for v in data_dict.values()] == [0, 0]
+
+    data_dict = profile.make_data_dict(
+        names=["a", "b"],
+        grids=[grid, grid],
+        colors=["red", "blue"],
+        axes=[0, 1],
+    )
+    assert [v["axis"] for v in data_dict.values()] == [0, 1]
+
+    # lists of different lengths raise an error instead of dropping entries
+    with pytest.raises(ValueError, match="same length"):
+        profile.make_data_dict(
+            names=["a", "b"],
+            grids=[grid],
+            colors=["red", "blue"],
+        )
+
+
+def test_create_profile_polyline_not_resampled():
+    """
+    test the create_profile function returns the polyline points if they don't need
+    resampling
+    """
+    # evenly spaced points along a line
+    polyline = pd.DataFrame(
+        {
+            "x": np.linspace(0, 4000, 9),
+            "y": np.linspace(0, 3000, 9),
+        }
+    )
+    expected = profile.cum_dist(polyline)[["x", "y", "dist"]].reset_index(drop=True)
+
+    # num isn't set
+    df = profile.create_profile("polyline", polyline=polyline)
+    pd.testing.assert_frame_equal(df, expected)
+
+    # num is the number of points, which are already evenly spaced
+    df = profile.create_profile("polyline", polyline=polyline, num=8)
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_rel_dist():
+    """
+    test the rel_dist function
+    """
+    df = pd.DataFrame({"x": [0.0, 3.0, 3.0, 0.0], "y": [0.0, 4.0, 8.0, 8.0]})
+
+    df_dist = profile.rel_dist(df)
+
+    expected = df.iloc[1:].assign(rel_dist=[5.0, 4.0, 3.0])
+    pd.testing.assert_frame_equal(df_dist, expected)
+    # input isn't altered
+    assert "rel_dist" not in df
+
+    df_dist = profile.rel_dist(df, reverse=True)
+
+    assert df_dist.index.tolist() == [1, 2, 3]
+    assert df_dist.rel_dist.tolist() == [3.0, 4.0, 5.0]
+
+
+def test_cum_dist_nans():
+    """
+    test the cum_dist function drops points with NaN distances, and skips them in the
+    cumulative distance
+    """
+    df = pd.DataFrame(
+        {
+            "x": [0.0, 3.0, np.nan, 3.0, 0.0],
+            "y": [0.0, 4.0, 6.0, 8.0, 8.0],
+        }
+    )
+
+    df_dist = profile.cum_dist(df)
+
+    # the NaN point and the point after it have no distance from the previous point
+    assert df_dist.index.tolist() == [1, 4]
+    assert df_dist.rel_dist.tolist() == [5.0, 3.0]
+    assert df_dist.dist.tolist() == [5.0, 8.0]
@@ -11,11 +11,15 @@ Tests for utils module.
 # %%
 from __future__ import annotations
 
+import os
+
+import geopandas as gpd
 import numpy as np
 import pandas as pd
 import pytest
 import verde as vd
 import xarray as xr
+from shapely.geometry import box
 
 from polartoolkit import regions, utils
 
@@ -73,6 +77,29 @@ def test_get_grid_info():
     assert info == (100.0, (-100.0, 100.0, 200.0, 400.0), 40000.0, 160000.0, "g")
 
 
+def test_get_grid_info_file(tmp_path):
+    """
+    test the get_grid_info function re-reads grid files which have changed
+    """
+    grid = dummy_grid().misfit
+    path = tmp_path / "grid.nc"
+    fname = str(path)
+    grid.to_netcdf(fname)
+
+    info = utils.get_grid_info(fname)
+    assert info == utils.get_grid_info(grid)
+    # cached info is the same
+    assert utils.get_grid_info(fname) == info
+
+    # overwrite the file with new values and a later modification time
+    (grid * 2).to_netcdf(fname)
+    mtime = path.stat().st_mtime + 10
+    os.utime(path, (mtime, mtime))
+
+    assert utils.get_grid_info(fname) == utils.get_grid_info(grid * 2)
+    assert utils.get_grid_info(fname)[2:4] == (80000.0, 320000.0)
+
+
 def test_dd2dms():
     """
     test the dd2dms function
@@ -206,6 +233,52 @@ def test_latlon_to_epsg3031_region():
     assert reg == pytest.approx(regions.ross_ice_shelf, abs=10)
 
 
+def test_latlon_to_epsg3031_list():
+    """
+    test the latlon_to_epsg3031 and epsg3031_to_latlon functions with lists of
+    coordinates
+    """
+    lat = np.array([-75.583047, -83.129754])
+    lon = np.array([-154.411487, -114.507405])
+
+    x, y = utils.latlon_to_epsg3031([lat, lon])
+
+    np.testing.assert_allclose(x, [-680000.0, -680000.0], atol=0.1)
+    np.testing.assert_allclose(y, [-1420000.0, -310000.0], atol=0.1)
+
+    # lists are returned in format [lat, lon]
+    lat_out, lon_out = utils.epsg3031_to_latlon([x, y])
+
+    np.testing.assert_allclose(lat_out, lat)
+    np.testing.assert_allclose(lon_out, lon)
+
+
+def test_latlon_to_epsg3031_not_altered():
+    """
+    test the latlon_to_epsg3031 function adds the new columns without altering the
+    input dataframe
+    """
+    df_ll = pd.DataFrame(
+        {
+            "latitude": [-75.583047, -76.296586],
+            "longitude": [-154.411487, 161.686184],
+            "z": [1.0, 2.0],
+        }
+    )
+    df_copy = df_ll.copy()
+
+    df_xy = utils.latlon_to_epsg3031(
+        df_ll,
+        input_coord_names=("longitude", "latitude"),
+        output_coord_names=("easting", "northing"),
+    )
+
+    pd.testing.assert_frame_equal(df_ll, df_copy)
+    pd.testing.assert_frame_equal(df_xy[df_ll.columns], df_ll)
+    assert df_xy.easting.tolist() == pytest.approx([-680000.0, 470000.0], abs=0.1)
+    assert df_xy.northing.tolist() == pytest.approx([-1420000.0, -1420000.0], abs=0.1)
+
+
 def test_epsg3031_to_latlon():
     """
     test the epsg3031_to_latlon function
@@ -273,3 +346,250 @@ def test_points_inside_region():
 
     assert len(df_out) == 1
     assert df_out.x.iloc[0] == 0.0
+
+
+def test_points_inside_region_columns():
+    """
+    test the points_inside_region function keeps the columns and index of the input
+    """
+    df = pd.DataFrame(
+        {
+            "easting": [-50e3, 0, 100e3],
+            "northing": [-1000e3, 0, -500e3],
+            "z": [1.0, 2.0, 3.0],
+        },
+        index=[5, 6, 7],
+    )
+
+    df_in = utils.points_inside_region(
+        df, regions.ross_ice_shelf, names=("easting", "northing")
+    )
+
+    pd.testing.assert_frame_equal(df_in, df.loc[[5, 7]])
+
+    # the result is a copy
+    df_in["z"] = 0.0
+    assert df.z.tolist() == [1.0, 2.0, 3.0]
+
+
+def test_points_inside_region_boundary():
+    """
+    test the points_inside_region function includes points on the region boundary,
+    the same as verde.inside
+    """
+    region = (-10.0, 10.0, -5.0, 5.0)
+    x, y = np.meshgrid(np.arange(-12, 13, 2.0), np.arange(-7, 8, 1.0))
+    df = pd.DataFrame({"x": x.ravel(), "y": y.ravel()})
+
+    df_in = utils.points_inside_region(df, region)
+    df_out = utils.points_inside_region(df, region, reverse=True)
+
+    inside = vd.inside((df.x, df.y), region=region)
+    pd.testing.assert_frame_equal(df_in, df[inside])
+    pd.testing.assert_frame_equal(df_out, df[~inside])
+    # the corners are inside
+    assert len(df_in) == 11 * 11
+
+
+def test_grd_compare_coincident_nodes():
+    """
+    test the grd_compare function cuts grids whose nodes coincide to their inner
+    region instead of resampling them
+    """
+    (x, y) = vd.grid_coordinates(region=(0, 10000, 0, 5000), spacing=100)
+    grid = vd.make_xarray_grid(
+        (x, y), np.sin(x / 1000) + y / 1000, data_names="z", dims=("y", "x")
+    ).z
+
+    da1 = grid.sel(x=slice(0, 8000))
+    da2 = grid.sel(x=slice(2000, 10000)) + 1
+
+    dif, grid1, grid2 = utils.grd_compare(da1, da2)
+
+    # the grids are cut to the inner region with their original values
+    xr.testing.assert_allclose(grid1, grid.sel(x=slice(2000, 8000)))
+    xr.testing.assert_allclose(grid2, grid.sel(x=slice(2000, 8000)) + 1)
+    assert dif.shape == (51, 61)
+    np.testing.assert_allclose(dif, -1)
+
+
+def test_shapes_to_df():
+    """
+    test the shapes_to_df function
+    """
+    # shapes as drawn with regions.draw_region, in lon, lat
+    shapes = [
+        [[-154.411487, -75.583047], [161.686184, -76.296586], [123.407825, -84.82147]],
+        [[-114.507405, -83.129754], [161.686184, -76.296586]],
+    ]
+
+    df = utils.shapes_to_df(shapes)
+
+    # same as concatenating a dataframe of each shape
+    expected = pd.concat(
+        pd.DataFrame(
+            {
+                "lon": [c[0] for c in shape],
+                "lat": [c[1] for c in shape],
+                "shape_num": i,
+            }
+        )
+        for i, shape in enumerate(shapes)
+    )
+    pd.testing.assert_frame_equal(
+        df[["lon", "lat", "shape_num"]], expected, check_index_type=False
+    )
+    # the index is the vertex number within each shape
+    assert df.index.tolist() == [0, 1, 2, 0, 1]
+    assert df.x.tolist() == pytest.approx(
+        [-680000.0, 470000.0, 470000.0, -680000.0, 470000.0], abs=1
+    )
+    assert df.y.tolist() == pytest.approx(
+        [-1420000.0, -1420000.0, -310000.0, -310000.0, -1420000.0], abs=1
+    )
+
+
+def test_gmt_str_to_list():
+    """
+    test the gmt_str_to_list function
+    """
+    # region with a z range
+    region = (-680e3, 470e3, -1420e3, -310e3, 0, 1000)
+
+    assert utils.gmt_str_to_list(region) == (
+        "-680000.0/470000.0/-1420000.0/-310000.0/0/1000"
+    )
+    assert utils.gmt_str_to_list(region) == "".join(f"{x}/" for x in region)[:-1]
+
+    # four value regions, with floats and ints
+    for region in [regions.ross_ice_shelf, (-10, 10, -5, 5)]:
+        assert utils.gmt_str_to_list(region) == "".join(f"{x}/" for x in region)[:-1]
+    assert utils.gmt_str_to_list((-10, 10, -5.5, 5)) == "-10/10/-5.5/5"
+
+
+def test_change_reg(tmp_path):
+    """
+    test the change_reg function toggles the registration of loaded grids the same as
+    with GMT grdedit for grid files
+    """
+    grid = dummy_grid().misfit
+    fname = str(tmp_path / "grid.nc")
+    grid.to_netcdf(fname)
+
+    grid_changed = utils.change_reg(grid)
+    file_changed = utils.change_reg(fname)
+
+    assert grid.gmt.registration == 0
+    assert grid_changed.gmt.registration == file_changed.gmt.registration == 1
+    np.testing.assert_allclose(grid_changed, file_changed)
+    # node coordinates are kept, GMT may rename the dimensions of the file
+    for dim, file_dim in zip(grid_changed.dims, file_changed.dims):
+        np.testing.assert_allclose(grid_changed[dim], file_changed[file_dim])
+
+
+def test_mask_from_shp_reprojects():
+    """
+    test that mask_from_shp only reprojects shapes which aren't in the grid's crs when
+    asked to
+    """
+    shp = gpd.GeoDataFrame(
+        geometry=[box(1000e3, 1000e3, 1040e3, 1040e3)],
+        crs="epsg:3031",
+    )
+    kwargs = {
+        "region": (960e3, 1080e3, 960e3, 1080e3),
+        "spacing": 10e3,
+        "masked": False,
+        "invert": False,
+    }
+
+    mask = utils.mask_from_shp(shp, **kwargs)
+    mask_not_reprojected = utils.mask_from_shp(shp.to_crs("epsg:4326"), **kwargs)
+    mask_reprojected = utils.mask_from_shp(
+        shp.to_crs("epsg:4326"), reproject=True, **kwargs
+    )
+
+    # the 4 x 4 nodes inside the box are unmasked
+    assert mask.sum() == 16
+    # lat/lon coordinates of the shape don't overlap the grid unless reprojected
+    assert mask_not_reprojected.sum() == 0
+    xr.testing.assert_equal(mask, mask_reprojected)
+
+
+def test_mask_from_polygon():
+    """
+    test the mask_from_polygon function masks with the polygon and not its convex hull
+    """
+    # L-shaped polygon, as drawn with regions.draw_region
+    df_xy = pd.DataFrame(
+        {
+            "x": [1000e3, 1040e3, 1040e3, 1020e3, 1020e3, 1000e3],
+            "y": [1000e3, 1000e3, 1020e3, 1020e3, 1040e3, 1040e3],
+        }
+    )
+    df_ll = utils.epsg3031_to_latlon(df_xy)
+    polygon = [df_ll[["lon", "lat"]].to_numpy().tolist()]
+
+    mask = utils.mask_from_polygon(
+        polygon,
+        region=(1000e3, 1040e3, 1000e3, 1040e3),
+        spacing=10e3,
+        return_mask_only=True,
+    )
+
+    # 5 x 3 nodes in the lower part of the L and 3 x 2 in the upper part, including
+    # those on the boundary
+    assert mask.sum() == 21
+    # node in the notch of the L is outside the polygon but inside its convex hull
+    assert not mask.sel(x=1030e3, y=1030e3)
+
+    masked = utils.mask_from_polygon(
+        polygon,
+        region=(1000e3, 1040e3, 1000e3, 1040e3),
+        spacing=10e3,
+        invert=True,
+    )
+    assert masked.notnull().sum() == 4
+
+
+@pytest.mark.parametrize("invert", [False, True])
+def test_mask_from_polygon_mask_only(invert):
+    """
+    test the mask_from_polygon function returns the same mask as the masked grid's
+    non-NaN nodes
+    """
+    df_xy = pd.DataFrame(
+        {
+            "x": [1000e3, 1040e3, 1000e3],
+            "y": [1000e3, 1000e3, 1040e3],
+        }
+    )
+    df_ll = utils.epsg3031_to_latlon(df_xy)
+    polygon = [df_ll[["lon", "lat"]].to_numpy().tolist()]
+    kwargs = {
+        "region": (990e3, 1050e3, 990e3, 1050e3),
+        "spacing": 10e3,
+        "invert": invert,
+    }
+
+    mask = utils.mask_from_polygon(polygon, return_mask_only=True, **kwargs)
+    masked = utils.mask_from_polygon(polygon, **kwargs)
+
+    assert mask.dtype == bool
+    assert 0 < mask.sum() < mask.size
+    xr.testing.assert_equal(mask, masked.notnull())
+
+
+def test_random_color():
+    """
+    test the random_color function is reproducible with a seed or a Generator
+    """
+    np.random.seed(0)  # noqa: NPY002
+    color = utils.random_color()
+    np.random.seed(0)  # noqa: NPY002
+    assert utils.random_color() == color
+
+    assert all(0 <= int(c) < 256 for c in color.split("/"))
+
+    color = utils.random_color(rng=np.random.default_rng(1))
+    assert utils.random_color(rng=np.random.default_rng(1)) == color